@@ -1,12 +1,15 @@
 # Crypto_Trading_Bot/agent/agent_context.py
 
+import asyncio
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Type
 import logging
+import aiohttp
 from agent.trading_models import AgentPortfolio
 from crypto_market_exchange_manager.market_data_models.models import BaseModel
 
 from api_client.OllamaClient import OllamaClient
+from crypto_news_aggregator import config as news_config
 from crypto_news_aggregator.utils import helpers
 from sentiment_analysis.sentiment_analyzer import SentimentAnalyzer
 
@@ -60,15 +63,20 @@ class AgentContext:
             logger.warning("No news aggregator sources configured in AgentContext.")
             return []
 
-        for source in self.news_aggregator_sources:
-            try:
-                target_coins_keywords = {coin: [coin] for coin in symbols} if symbols else {}
-                # Fetch news from the source
-                articles = source.fetch_news(target_coins_keywords=target_coins_keywords, limit=limit_per_source)
-                all_articles.extend(articles)
-                logger.debug(f"Fetched {len(articles)} articles from {source.__class__.__name__}")
-            except Exception as e:
-                logger.error(f"Error fetching news from {source.__class__.__name__}: {e}")
+        target_coins_keywords = {coin: [coin] for coin in symbols} if symbols else {}
+        # All sources at once over one shared connection pool, so the wait is the slowest source, not the sum
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=news_config.REQUEST_TIMEOUT)) as session:
+            results = await asyncio.gather(
+                *(source.fetch_news_async(target_coins_keywords=target_coins_keywords, limit=limit_per_source, session=session)
+                  for source in self.news_aggregator_sources),
+                return_exceptions=True
+            )
+        for source, articles in zip(self.news_aggregator_sources, results):
+            if isinstance(articles, Exception):
+                logger.error(f"Error fetching news from {source.__class__.__name__}: {articles}")
+                continue
+            all_articles.extend(articles)
+            logger.debug(f"Fetched {len(articles)} articles from {source.__class__.__name__}")
         print(f"Fetched {len(all_articles)} articles from all sources.")
         unique_articles_dict = {article.link: article for article in all_articles if hasattr(article, 'link')}
         print(f"Found {len(unique_articles_dict)} unique articles.")
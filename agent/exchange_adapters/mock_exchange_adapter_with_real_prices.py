@@ -44,13 +44,27 @@ class MockExchangeAdapterWithRealtimeData(BaseExchangeAdapter):
 
     async def get_current_price(self, symbol: str) -> Optional[float]:
         # Use the real-time price from the market data source
-        logger.info(f"Fetching real-time price for {symbol} from market data source.")
+        logger.debug("Fetching real-time price for %s from market data source.", symbol)
         price = self.market_data_source.get_current_price(symbol)
         if price is None:
             logger.warning(f"No real-time price available for {symbol}. Using fallback of 1.0.")
             return 1.0
         return price
 
+    async def _get_asset_prices(self, assets: List[str], quote: str) -> Dict[str, float]:
+        # One batched market data request for all assets instead of one ticker round-trip each
+        if not assets:
+            return {}
+        prices = self.market_data_source.get_current_price([f"{asset}/{quote}" for asset in assets])
+        asset_prices = {}
+        for asset in assets:
+            price = prices.get(f"{asset}/{quote}")
+            if price is None:
+                logger.warning(f"No real-time price available for {asset}/{quote}. Using fallback of 1.0.")
+                price = 1.0
+            asset_prices[asset] = price
+        return asset_prices
+
     async def create_order(self, order_request: OrderRequest) -> ExecutedOrder:
         logger.info(f"MockExchange (Realtime): Received order request: {order_request.model_dump_json(indent=2)}")
 
@@ -124,9 +138,7 @@ class MockExchangeAdapterWithRealtimeData(BaseExchangeAdapter):
             self.portfolio.update_cash(quote_currency, cost_or_proceeds)
             self.portfolio.update_cash(quote_currency, -commission)
 
-        asset_price_dictionary = {}
-        for asset in self.portfolio.asset_holdings:
-            asset_price_dictionary[asset] = await self.get_current_price(f"{asset}/USDT")
+        asset_price_dictionary = await self._get_asset_prices(list(self.portfolio.asset_holdings), quote="USDT")
         self.portfolio.calculate_total_value(asset_price_dictionary)
 
         executed_order = ExecutedOrder(
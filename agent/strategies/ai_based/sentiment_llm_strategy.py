@@ -84,31 +84,35 @@ class SentimentLLMStrategy(BaseStrategy):
 
         total_score = 0.0
         valid_analyses = 0
-        
+
+        items = []
         for article in articles:
             text_to_analyze = article.title
             if article.content_snippet: # Prioritize content if available and not too long
                  # Simple heuristic: use first 500 chars of content if available
                 text_to_analyze += ". " + article.content_snippet[:500] 
+            items.append((text_to_analyze, symbol))
 
-            try:
-                # Assuming analyze_sentiment returns a dict like {'label': 'POSITIVE', 'score': 0.8}
-                # The score should ideally be normalized, e.g., -1 (very negative) to +1 (very positive)
-                sentiment_result = self.context.sentiment_analyzer.analyze_sentiment(text_to_analyze, target_coin=symbol)
-                convert = {
-                    "Positive": 1.0,
-                    "Negative": -1.0,
-                    "Neutral": 0.0
-                }
-
-                if convert.get(sentiment_result) is not None:
-                    total_score += convert[sentiment_result]
-                    valid_analyses += 1
-                    logger.debug(f"[{self.strategy_name}] Sentiment for '{article.title}' ({symbol}): {convert[sentiment_result]:.2f}")
-                else:
-                    logger.warning(f"[{self.strategy_name}] Invalid sentiment result for article: {article.title}")
-            except Exception as e:
-                logger.error(f"[{self.strategy_name}] Error analyzing sentiment for article '{article.title}': {e}")
+        try:
+            # One LLM request per batch of headlines instead of one per article; batches run concurrently
+            sentiment_results = await self.context.sentiment_analyzer.analyze_sentiments_batch_async(items)
+        except Exception as e:
+            logger.error(f"[{self.strategy_name}] Error analyzing sentiment for {symbol}: {e}")
+            return 0.0
+
+        convert = {
+            "Positive": 1.0,
+            "Negative": -1.0,
+            "Neutral": 0.0
+        }
+        for article, sentiment_result in zip(articles, sentiment_results):
+            # The score should ideally be normalized, e.g., -1 (very negative) to +1 (very positive)
+            if convert.get(sentiment_result) is not None:
+                total_score += convert[sentiment_result]
+                valid_analyses += 1
+                logger.debug(f"[{self.strategy_name}] Sentiment for '{article.title}' ({symbol}): {convert[sentiment_result]:.2f}")
+            else:
+                logger.warning(f"[{self.strategy_name}] Invalid sentiment result for article: {article.title}")
         
         if valid_analyses == 0:
             return 0.0
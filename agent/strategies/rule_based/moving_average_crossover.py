@@ -7,8 +7,8 @@ import pandas as pd # For TA calculations
 from agent.strategies.base_strategy import BaseStrategy
 from agent.agent_context import AgentContext
 from agent.trading_models import TradingSignal, OrderAction, AgentPortfolio
-# Assuming OHLCV model is available from market_data_models
-from crypto_market_exchange_manager.market_data_models.models import OHLCV
+# Assuming OHLCVFrame model is available from market_data_models
+from crypto_market_exchange_manager.market_data_models.models import OHLCVFrame
 
 logger = logging.getLogger(__name__)
 
@@ -42,21 +42,22 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
         try:
             # Fetch enough data for the longest window + a bit more for stability
             limit = self.long_window + 50 
-            ohlcv_data: List[OHLCV] = self.context.market_data_source.fetch_ohlcv(
+            ohlcv_data: OHLCVFrame = self.context.market_data_source.fetch_ohlcv_frame(
                 symbol=self.symbol,
                 timeframe=self.timeframe,
                 limit=limit
             )
 
-            if not ohlcv_data or len(ohlcv_data) < self.long_window:
+            if len(ohlcv_data) < self.long_window:
                 logger.warning(f"[{self.strategy_name}] Not enough OHLCV data for {self.symbol}. Need {self.long_window}, got {len(ohlcv_data)}.")
                 return False
 
-            # Convert to DataFrame
-            df = pd.DataFrame([{"timestamp": o.timestamp, "open": o.open, "high": o.high, 
-                                "low": o.low, "close": o.close, "volume": o.volume} for o in ohlcv_data])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df = df.set_index('timestamp')
+            # Columns go straight into the DataFrame; no per-candle Python objects
+            df = pd.DataFrame(
+                {"open": ohlcv_data.open, "high": ohlcv_data.high, "low": ohlcv_data.low,
+                 "close": ohlcv_data.close, "volume": ohlcv_data.volume},
+                index=pd.to_datetime(ohlcv_data.timestamp, unit='ms').rename('timestamp')
+            )
             
             df[f'sma_short'] = df['close'].rolling(window=self.short_window).mean()
             df[f'sma_long'] = df['close'].rolling(window=self.long_window).mean()
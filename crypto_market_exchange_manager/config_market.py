@@ -7,6 +7,37 @@ load_dotenv()
 # Binance API Credentials (Optional, for higher rate limits or private endpoints)
 BINANCE_API_KEY = os.getenv("BINANCE_API_KEY")
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET")
+BINANCE_SANDBOX = True # Use the Binance testnet
+
+# Client-side request-weight budget (replaces CCXT's fixed-delay limiter).
+# Binance allows 1200 request weight per minute per IP; part of it is held back for order cancels.
+BINANCE_WEIGHT_LIMIT_PER_MINUTE = 1200
+BINANCE_WEIGHT_RESERVE_RATIO = 0.1
+# Request weight per CCXT method (see Binance API docs). fetch_tickers and fetch_order_book
+# depend on the request size and are computed in binance_source.
+BINANCE_ENDPOINT_WEIGHTS = {
+    'load_markets': 20,
+    'fetch_ohlcv': 2,
+    'fetch_ticker': 2,
+    'fetch_trades': 25,
+    'create_order': 1,
+    'cancel_order': 1,
+    'fetch_order': 4,
+    'fetch_open_orders': 6, # 80 without a symbol
+    'fetch_balance': 20,
+}
+
+# Upper bound on in-flight async requests per market data source
+MAX_CONCURRENT_REQUESTS = 64
+
+# HTTP connection pooling (keep-alive reuse avoids a TCP+TLS handshake per request)
+HTTP_POOL_CONNECTIONS = 32 # Sync: number of per-host pools
+HTTP_POOL_MAXSIZE = 64 # Sync: connections kept alive per pool, should be >= worker count
+HTTP_MAX_RETRIES = 3 # Sync: retries on connection errors
+HTTP_RETRY_BACKOFF = 0.2 # Seconds, exponential backoff factor between retries
+ASYNC_CONNECTOR_LIMIT = 128 # Async: total open connections
+ASYNC_CONNECTOR_LIMIT_PER_HOST = 64 # Async: open connections per host
+ASYNC_DNS_CACHE_TTL = 300 # Async: seconds to cache DNS lookups
 
 # Target symbols for fetching data (format: BASE/QUOTE, e.g., BTC/USDT)
 DEFAULT_SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
@@ -15,10 +46,24 @@ DEFAULT_SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
 # Binance examples: '1m', '5m', '15m', '1h', '4h', '1d', '1w', '1M'
 DEFAULT_TIMEFRAME = "1h"
 DEFAULT_OHLCV_LIMIT = 100 # Default number of candles to fetch
+BINANCE_KLINES_MAX_LIMIT = 1000 # Max candles per spot /klines request (ccxt caps larger limits itself)
+
+# Max symbols per fetch_tickers request when batching (Binance /ticker/24hr accepts a symbols array)
+TICKERS_BATCH_SIZE = 100
+
+# Seconds to serve market metadata (/exchangeInfo) from memory before reloading
+MARKETS_CACHE_TTL = 3600
 
 # Order book depth
 DEFAULT_ORDER_BOOK_LIMIT = 20 # Number of bids and asks
 
+# Keep the raw exchange response in the `info` field of Ticker/OrderBook/Trade models.
+# Disabled by default: ccxt's raw payloads dominate memory for large fetch_tickers calls.
+KEEP_RAW_INFO = False
+
+# Log exchange capabilities when the example fetcher starts (diagnostic, off by default)
+VERBOSE_STARTUP = False
+
 # Request timeout
 REQUEST_TIMEOUT = 20 # Seconds
 
@@ -1,7 +1,9 @@
 # crypto_market_data_fetcher/data_sources/base_market_source.py
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from ..market_data_models.models import OHLCV, Ticker, OrderBook, Trade # Use .. for relative if running as package
+from typing import List, Optional, Dict, Any, Union
+from ..market_data_models.models import OHLCV, OHLCVFrame, Ticker, OrderBook, Trade # Use .. for relative if running as package
 from ..utils.market_helpers import logger # Use .. for relative if running as package
 
 class BaseMarketDataSource(ABC):
@@ -26,6 +28,20 @@ class BaseMarketDataSource(ABC):
         """Fetches OHLCV (candlestick) data."""
         pass
 
+    def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: Optional[int] = None, # Timestamp in ms
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> OHLCVFrame:
+        """
+        Fetches OHLCV data as a columnar OHLCVFrame (numpy arrays) for vectorized indicator math.
+        The default converts fetch_ohlcv's models; sources can override it to skip the models entirely.
+        """
+        return OHLCVFrame.from_ohlcv(self.fetch_ohlcv(symbol, timeframe, since, limit, params), symbol, timeframe)
+
     @abstractmethod
     def fetch_ticker(self, symbol: str, params: Optional[Dict[str, Any]] = None) -> Optional[Ticker]:
         """Fetches ticker information for a symbol."""
@@ -46,8 +62,48 @@ class BaseMarketDataSource(ABC):
         """Fetches recent public trades for a symbol."""
         pass
 
+    # Async variants. Sources with a native async client override these; the defaults
+    # run the sync call in a worker thread so every source can be awaited and gathered.
+    async def fetch_ohlcv_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[OHLCV]:
+        """Fetches OHLCV (candlestick) data without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_ohlcv, symbol, timeframe, since, limit, params)
+
+    async def fetch_ticker_async(self, symbol: str, params: Optional[Dict[str, Any]] = None) -> Optional[Ticker]:
+        """Fetches ticker information for a symbol without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_ticker, symbol, params)
+
+    async def fetch_order_book_async(self, symbol: str, limit: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Optional[OrderBook]:
+        """Fetches the order book for a symbol without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_order_book, symbol, limit, params)
+
+    async def fetch_trades_async(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> List[Trade]:
+        """Fetches recent public trades for a symbol without blocking the event loop."""
+        return await asyncio.to_thread(self.fetch_trades, symbol, since, limit, params)
+
+    async def fetch_tickers_concurrently(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """
+        Fetches one ticker per symbol with all requests in flight at once. Fallback for sources without a
+        batch tickers endpoint; sources that have one (e.g. BinanceSource.fetch_tickers_batched_async)
+        should be called through it instead, since this costs one request per symbol.
+        """
+        tickers = await asyncio.gather(*(self.fetch_ticker_async(symbol) for symbol in symbols))
+        return {symbol: ticker for symbol, ticker in zip(symbols, tickers) if ticker}
+
+    async def close(self) -> None:
+        """Releases async resources held by the source. No-op by default."""
+        pass
+
     def check_exchange_capabilities(self):
-        """Logs capabilities of the exchange client."""
+        """Logs capabilities of the exchange client. Diagnostic only; a no-op unless INFO logging is enabled."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if hasattr(self.client, 'has'):
             self.logger.info(f"Capabilities for {self.exchange_name}:")
             self.logger.info(f"  Fetch OHLCV: {self.client.has.get('fetchOHLCV')}")
@@ -84,8 +140,8 @@ class BaseMarketDataSource(ABC):
         pass
 
     @abstractmethod
-    def get_current_price(self, symbol: str) -> Optional[float]:
-        """Fetches the current price for a symbol."""
+    def get_current_price(self, symbol: Union[str, List[str]]) -> Union[Optional[float], Dict[str, float]]:
+        """Fetches the current price for a symbol, or a symbol -> price dict when given a list of symbols."""
         pass
 
     @abstractmethod
@@ -1,80 +1,261 @@
 # crypto_market_data_fetcher/data_sources/binance_source.py
+import asyncio
+import threading
+import time
+from functools import partial
+import aiohttp
 import ccxt
-from typing import List, Optional, Dict, Any
+import ccxt.async_support as ccxt_async
+from ccxt.base import exchange as _ccxt_exchange # Module-level json_parser: the decoder ccxt picked
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Optional, Dict, Any, Tuple, Union
 from .base_market_source import BaseMarketDataSource
 # Use .. for relative imports if running main_market_data.py as part of a package
-from ..market_data_models.models import OHLCV, Ticker, OrderBook, Trade
+from ..market_data_models.models import OHLCV, OHLCVFrame, Ticker, OrderBook, Trade
 from ..utils.market_helpers import (
     logger,
+    chunked,
     ccxt_ohlcv_to_pydantic,
+    ccxt_ohlcv_to_frame,
     ccxt_ticker_to_pydantic,
+    ccxt_tickers_to_pydantic,
     ccxt_order_book_to_pydantic,
     ccxt_trades_to_pydantic
 )
+from ..utils.rate_limiter import WeightRateLimiter
 from .. import config_market # Import the market-specific config
 
+# ccxt decodes responses through its Exchange.on_json_response hook, which is already orjson.loads
+# when orjson is importable. Override the hook only with a decoder ccxt would not choose itself:
+# simdjson (CPU-feature dispatch on load) if installed, or, where ccxt fell back to the stdlib json, jiter via
+# pydantic-core (always installed with pydantic), whose string cache dedupes the symbol/asset keys
+# repeated thousands of times in load_markets payloads. None keeps ccxt's own decoder.
+try:
+    import simdjson
+    _json_loads = simdjson.loads
+except ImportError:
+    if getattr(_ccxt_exchange.json_parser, '__name__', None) == 'orjson':
+        _json_loads = None # ccxt already decodes with orjson
+    else:
+        import pydantic_core
+        _json_loads = partial(pydantic_core.from_json, cache_strings='all')
+
+def _build_http_session() -> requests.Session:
+    """Creates a keep-alive requests session with a connection pool sized for concurrent workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config_market.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config_market.HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=config_market.HTTP_MAX_RETRIES, backoff_factor=config_market.HTTP_RETRY_BACKOFF),
+    )
+    session.mount('https://', adapter)
+    return session
+
+# Sync CCXT clients shared by every BinanceSource with the same credentials, so instances
+# reuse one HTTP session and one loaded markets table instead of each loading their own
+_CLIENTS: Dict[Tuple[Optional[str], bool], ccxt.binance] = {} # type: ignore
+_CLIENTS_LOCK = threading.Lock()
+
+# Binance meters request weight per IP, so every BinanceSource in the process shares one budget
+_RATE_LIMITER = WeightRateLimiter(
+    max_weight=config_market.BINANCE_WEIGHT_LIMIT_PER_MINUTE,
+    reserve_ratio=config_market.BINANCE_WEIGHT_RESERVE_RATIO,
+)
+
+def _tickers_weight(symbols: Optional[List[str]]) -> int:
+    """Request weight of /ticker/24hr, which scales with the number of symbols."""
+    if not symbols or len(symbols) > 100:
+        return 80
+    return 2 if len(symbols) <= 20 else 40
+
+def _order_book_weight(limit: Optional[int]) -> int:
+    """Request weight of /depth, which scales with the requested depth."""
+    if not limit or limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    return 50 if limit <= 1000 else 250
+
 class BinanceSource(BaseMarketDataSource):
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
         super().__init__(exchange_name="binance")
         self.api_key = api_key or config_market.BINANCE_API_KEY
         self.api_secret = api_secret or config_market.BINANCE_API_SECRET
         self.client: ccxt.binance = self._init_client() # type: ignore
+        # Capabilities are static per client; snapshot them instead of querying client.has on every fetch
+        has = self.client.has
+        self._has_ohlcv = bool(has.get('fetchOHLCV'))
+        self._has_ticker = bool(has.get('fetchTicker'))
+        self._has_tickers = bool(has.get('fetchTickers'))
+        self._has_order_book = bool(has.get('fetchOrderBook'))
+        self._has_trades = bool(has.get('fetchTrades'))
+        self._market_cache: Dict[str, Dict[str, Any]] = {} # symbol -> ccxt market dict, filled on first use
+        self._market_cache_ts: float = 0.0 # monotonic time of the last load_markets
+        # Async client and its concurrency cap are created lazily inside the running event loop
+        self._async_client: Optional[ccxt_async.binance] = None # type: ignore
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+    def _exchange_params(self) -> Dict[str, Any]:
+        """Builds the CCXT constructor params shared by the sync and async clients."""
+        exchange_params = {
+            'apiKey': self.api_key,
+            'secret': self.api_secret,
+            'enableRateLimit': False, # Throttled by the shared weight-aware _RATE_LIMITER instead of CCXT's per-call sleep
+            'options': {
+                'adjustForTimeDifference': True, # Adjusts for clock skew
+                #'defaultType': 'spot', # Or 'future', 'margin'
+            }
+        }
+        # Remove None values for apiKey and secret if not provided
+        if not exchange_params['apiKey']: del exchange_params['apiKey']
+        if not exchange_params['secret']: del exchange_params['secret']
+        return exchange_params
 
     def _init_client(self) -> ccxt.binance: # type: ignore
+        """Returns the shared CCXT Binance client for this API key, creating it on first use."""
+        key = (self.api_key, config_market.BINANCE_SANDBOX)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _CLIENTS[key] = self._build_client()
+        return client
+
+    def _build_client(self) -> ccxt.binance: # type: ignore
         """Initializes the CCXT Binance client."""
         try:
-            exchange_params = {
-                'apiKey': self.api_key,
-                'secret': self.api_secret,
-                'enableRateLimit': False, # Recommended by CCXT
-                'options': {
-                    'adjustForTimeDifference': True, # Adjusts for clock skew
-                    #'defaultType': 'spot', # Or 'future', 'margin'
-                }
-            }
-            # Remove None values for apiKey and secret if not provided
-            if not exchange_params['apiKey']: del exchange_params['apiKey']
-            if not exchange_params['secret']: del exchange_params['secret']
-
-            client = ccxt.binance()
-            client.set_sandbox_mode(True) # For testing with Binance testnet
+            exchange_params = self._exchange_params()
+            exchange_params['session'] = _build_http_session()
+            client = ccxt.binance(exchange_params)
+            client.set_sandbox_mode(config_market.BINANCE_SANDBOX) # True for testing with Binance testnet
+            if _json_loads is not None:
+                client.on_json_response = _json_loads # Plain instance attribute: called as on_json_response(body)
             self.logger.info("CCXT Binance client initialized successfully.")
             return client
         except Exception as e:
             self.logger.error(f"Failed to initialize CCXT Binance client: {e}")
             raise # Re-raise the exception to halt if client initialization fails
 
-    def fetch_ohlcv(
+    def _get_async_client(self) -> ccxt_async.binance: # type: ignore
+        """Returns the CCXT async Binance client, creating it (and the request semaphore) on first use."""
+        if self._async_client is None:
+            self._aiohttp_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=config_market.ASYNC_CONNECTOR_LIMIT,
+                limit_per_host=config_market.ASYNC_CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=config_market.ASYNC_DNS_CACHE_TTL,
+            ))
+            exchange_params = self._exchange_params()
+            exchange_params['session'] = self._aiohttp_session # ccxt leaves closing a passed-in session to us
+            client = ccxt_async.binance(exchange_params)
+            client.set_sandbox_mode(config_market.BINANCE_SANDBOX) # True for testing with Binance testnet
+            if _json_loads is not None:
+                client.on_json_response = _json_loads # Plain instance attribute: called as on_json_response(body)
+            self._async_client = client
+            self._async_semaphore = asyncio.Semaphore(config_market.MAX_CONCURRENT_REQUESTS)
+            self.logger.info("CCXT async Binance client initialized successfully.")
+        return self._async_client
+
+    async def close(self) -> None:
+        """Closes the async client's HTTP session. Call before the event loop that used it shuts down."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_semaphore = None
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _call(self, method: str, *args: Any, weight: Optional[int] = None, critical: bool = False, **kwargs: Any) -> Any:
+        """Runs a CCXT client method under the shared request-weight budget."""
+        _RATE_LIMITER.acquire(weight or config_market.BINANCE_ENDPOINT_WEIGHTS.get(method, 1), critical=critical)
+        try:
+            return getattr(self.client, method)(*args, **kwargs)
+        finally:
+            _RATE_LIMITER.update_from_headers(self.client.last_response_headers)
+
+    async def _call_async(self, method: str, *args: Any, weight: Optional[int] = None, critical: bool = False, **kwargs: Any) -> Any:
+        """Async _call on the async client, also bounded by the in-flight request semaphore."""
+        client = self._get_async_client()
+        async with self._async_semaphore:
+            await _RATE_LIMITER.acquire_async(weight or config_market.BINANCE_ENDPOINT_WEIGHTS.get(method, 1), critical=critical)
+            try:
+                return await getattr(client, method)(*args, **kwargs)
+            finally:
+                _RATE_LIMITER.update_from_headers(client.last_response_headers)
+
+    @staticmethod
+    def _kw(**kwargs: Any) -> Dict[str, Any]:
+        """Drops None-valued arguments so CCXT falls back to its own defaults."""
+        return {k: v for k, v in kwargs.items() if v is not None}
+
+    def _get_markets(self) -> Dict[str, Dict[str, Any]]:
+        """Returns symbol -> ccxt market, reloading /exchangeInfo at most once per config_market.MARKETS_CACHE_TTL."""
+        now = time.monotonic()
+        if not self._market_cache or now - self._market_cache_ts > config_market.MARKETS_CACHE_TTL:
+            self._call('load_markets', reload=bool(self._market_cache))
+            self._market_cache = self.client.markets # ccxt's own symbol -> market dict, replaced on each reload
+            self._market_cache_ts = now
+        return self._market_cache
+
+    def _known_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Drops (and logs) symbols missing from the cached markets. ccxt's fetch_tickers rejects a whole
+        request with BadSymbol if any one symbol is unknown, so a delisted pair would cost its chunk every price.
+        If the markets cannot be loaded, the symbols are returned unchanged.
+        """
+        try:
+            markets = self._get_markets()
+        except Exception as e:
+            self.logger.warning(f"Could not load markets to check symbols: {e}")
+            return list(symbols)
+        known = [sym for sym in symbols if sym in markets]
+        if len(known) < len(symbols):
+            self.logger.warning(f"Skipping unknown symbols: {[sym for sym in symbols if sym not in markets]}")
+        return known
+
+    def _get_market(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Returns the ccxt market for a symbol from the cached markets."""
+        return self._get_markets().get(symbol)
+
+    def _fetch_raw_ohlcv(
         self,
         symbol: str,
-        timeframe: str = config_market.DEFAULT_TIMEFRAME,
-        since: Optional[int] = None,
-        limit: Optional[int] = config_market.DEFAULT_OHLCV_LIMIT,
-        params: Optional[Dict[str, Any]] = None
-    ) -> List[OHLCV]:
-        self.logger.debug(f"Fetching OHLCV for {symbol} on timeframe {timeframe} with limit {limit}")
+        timeframe: str,
+        since: Optional[int],
+        limit: Optional[int],
+        params: Optional[Dict[str, Any]],
+        raw_klines: bool = False
+    ) -> List[List[Any]]:
+        """
+        Fetches raw candles for fetch_ohlcv / fetch_ohlcv_frame; logs errors and returns [] on failure.
+        With raw_klines, the common (since=None, params=None) spot case returns Binance's /klines rows as
+        decoded, skipping CCXT's per-candle parsing; only the first six columns are OHLCV and the
+        prices are numeric strings, so the caller must convert them in bulk (see ccxt_ohlcv_to_frame).
+        """
+        self.logger.debug("Fetching OHLCV for %s on timeframe %s with limit %s", symbol, timeframe, limit)
         try:
-            if not self.client.has['fetchOHLCV']:
+            if not self._has_ohlcv:
                 self.logger.warning(f"Binance client does not support fetchOHLCV.")
                 return []
-            parameters = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'since': since,
-                'limit': limit,
-                'params': params
-            }
-
-            if not since:
-                parameters.pop('since')
-            if not limit:
-                parameters.pop('limit')
-            if not params:
-                parameters.pop('params')
-             
             # CCXT expects symbol in 'BASE/QUOTE' format
-            raw_ohlcv = self.client.fetch_ohlcv(**parameters)
-            return ccxt_ohlcv_to_pydantic(raw_ohlcv, symbol, timeframe)
+            # Spot /klines only: futures candles come from other endpoints, and ccxt caps the limit we'd send as-is
+            if (
+                raw_klines and since is None and params is None
+                and (limit is None or limit <= config_market.BINANCE_KLINES_MAX_LIMIT)
+                and (market := self._get_market(symbol)) and market.get('spot')
+            ):
+                request = {'symbol': market['id'], 'interval': self.client.timeframes.get(timeframe, timeframe)}
+                if limit:
+                    request['limit'] = limit
+                raw_ohlcv = self._call('publicGetKlines', request, weight=config_market.BINANCE_ENDPOINT_WEIGHTS['fetch_ohlcv'])
+            elif since is None and params is None:
+                # Common polling case: positional arguments, no kwargs dict to build and filter
+                raw_ohlcv = self._call('fetch_ohlcv', symbol, timeframe, None, limit, weight=config_market.BINANCE_ENDPOINT_WEIGHTS['fetch_ohlcv'])
+            else:
+                raw_ohlcv = self._call('fetch_ohlcv', **self._kw(symbol=symbol, timeframe=timeframe, since=since, limit=limit, params=params))
+            return raw_ohlcv or []
         except ccxt.NetworkError as e:
             self.logger.error(f"CCXT NetworkError fetching OHLCV for {symbol}: {e}")
         except ccxt.ExchangeError as e:
@@ -83,98 +264,157 @@ class BinanceSource(BaseMarketDataSource):
             self.logger.error(f"Unexpected error fetching OHLCV for {symbol}: {e}", exc_info=True)
         return []
 
-    def fetch_ticker(self, symbol: str, params: Optional[Dict[str, Any]] = None) -> Optional[Ticker]:
-        self.logger.debug(f"Fetching ticker for {symbol}")
+    def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = config_market.DEFAULT_TIMEFRAME,
+        since: Optional[int] = None,
+        limit: Optional[int] = config_market.DEFAULT_OHLCV_LIMIT,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[OHLCV]:
+        return ccxt_ohlcv_to_pydantic(self._fetch_raw_ohlcv(symbol, timeframe, since, limit, params), symbol, timeframe)
+
+    def fetch_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = config_market.DEFAULT_TIMEFRAME,
+        since: Optional[int] = None,
+        limit: Optional[int] = config_market.DEFAULT_OHLCV_LIMIT,
+        params: Optional[Dict[str, Any]] = None
+    ) -> OHLCVFrame:
+        # The frame converter parses all rows in one numpy call, so raw /klines rows can go straight in
+        return ccxt_ohlcv_to_frame(self._fetch_raw_ohlcv(symbol, timeframe, since, limit, params, raw_klines=True), symbol, timeframe)
+
+    def fetch_ticker(self, symbol: str, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Optional[Ticker]:
+        self.logger.debug("Fetching ticker for %s", symbol)
         try:
-            if not self.client.has['fetchTicker']:
+            if not self._has_ticker:
                 self.logger.warning(f"Binance client does not support fetchTicker.")
                 return None
-            parameters = {
-                'symbol': symbol,
-                'params': params
-            }
-            if not params:
-                parameters.pop('params')
-
-            raw_ticker = self.client.fetch_ticker(**parameters)
-            return ccxt_ticker_to_pydantic(raw_ticker)
+            raw_ticker = self._call('fetch_ticker', **self._kw(symbol=symbol, params=params))
+            return ccxt_ticker_to_pydantic(raw_ticker, keep_raw=keep_raw)
         except Exception as e:
             self.logger.error(f"Error fetching ticker for {symbol}: {e}", exc_info=True)
         return None
 
-    def fetch_tickers(self, symbols: Optional[List[str]] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Ticker]:
-        self.logger.debug(f"Fetching tickers for {symbols if symbols else 'all available'}")
+    def fetch_tickers(self, symbols: Optional[List[str]] = None, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Dict[str, Ticker]:
+        self.logger.debug("Fetching tickers for %s", symbols if symbols else 'all available')
         tickers_dict: Dict[str, Ticker] = {}
         try:
-            if not self.client.has['fetchTickers']:
+            if not self._has_tickers:
                 self.logger.warning(f"Binance client does not support fetchTickers.")
                 return tickers_dict
-            parameters = {
-                'symbols': symbols,
-                'params': params
-            }
-            if not symbols:
-                parameters.pop('symbols')
-            if not params:
-                parameters.pop('params')
-            raw_tickers = self.client.fetch_tickers(**parameters) # symbols can be None for all
-            for symbol_key, raw_ticker_data in raw_tickers.items():
-                pydantic_ticker = ccxt_ticker_to_pydantic(raw_ticker_data)
-                if pydantic_ticker:
-                    tickers_dict[symbol_key] = pydantic_ticker
-            return tickers_dict
+            raw_tickers = self._call('fetch_tickers', weight=_tickers_weight(symbols), **self._kw(symbols=symbols or None, params=params)) # symbols can be None for all
+            return ccxt_tickers_to_pydantic(raw_tickers, keep_raw=keep_raw)
         except Exception as e:
             self.logger.error(f"Error fetching tickers for {symbols}: {e}", exc_info=True)
         return tickers_dict
 
-    def fetch_order_book(self, symbol: str, limit: Optional[int] = config_market.DEFAULT_ORDER_BOOK_LIMIT, params: Optional[Dict[str, Any]] = None) -> Optional[OrderBook]:
-        self.logger.debug(f"Fetching order book for {symbol} with limit {limit}")
+    def fetch_tickers_batched(self, symbols: List[str], chunk_size: int = config_market.TICKERS_BATCH_SIZE, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Dict[str, Ticker]:
+        """
+        Fetches tickers for many symbols using one fetch_tickers request per chunk
+        instead of one fetch_ticker round-trip per symbol.
+        :param symbols: Trading pair symbols
+        :param chunk_size: Max symbols per request
+        :return: Dict of symbol -> Ticker (unknown symbols and symbols that failed are omitted)
+        """
+        tickers_dict: Dict[str, Ticker] = {}
+        for chunk in chunked(self._known_symbols(symbols), chunk_size):
+            tickers_dict.update(self.fetch_tickers(chunk, params=params, keep_raw=keep_raw))
+        return tickers_dict
+
+    def fetch_order_book(self, symbol: str, limit: Optional[int] = config_market.DEFAULT_ORDER_BOOK_LIMIT, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Optional[OrderBook]:
+        self.logger.debug("Fetching order book for %s with limit %s", symbol, limit)
         try:
-            if not self.client.has['fetchOrderBook']:
+            if not self._has_order_book:
                 self.logger.warning(f"Binance client does not support fetchOrderBook.")
                 return None
-            parameters = {
-                'symbol': symbol,
-                'limit': limit,
-                'params': params
-            }
-            if not limit:
-                parameters.pop('limit')
-            if not params:
-                parameters.pop('params')
-            
-            raw_ob = self.client.fetch_order_book(**parameters)
-            return ccxt_order_book_to_pydantic(raw_ob)
+            raw_ob = self._call('fetch_order_book', weight=_order_book_weight(limit), **self._kw(symbol=symbol, limit=limit, params=params))
+            return ccxt_order_book_to_pydantic(raw_ob, keep_raw=keep_raw)
         except Exception as e:
             self.logger.error(f"Error fetching order book for {symbol}: {e}", exc_info=True)
         return None
 
-    def fetch_trades(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = 25, params: Optional[Dict[str, Any]] = None) -> List[Trade]:
-        self.logger.debug(f"Fetching trades for {symbol} with limit {limit}")
+    def fetch_trades(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = 25, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> List[Trade]:
+        self.logger.debug("Fetching trades for %s with limit %s", symbol, limit)
         try:
-            if not self.client.has['fetchTrades']:
+            if not self._has_trades:
                 self.logger.warning(f"Binance client does not support fetchTrades.")
                 return []
-            parameters = {
-                'symbol': symbol,
-                'since': since,
-                'limit': limit,
-                'params': params
-            }
-
-            if not since:
-                parameters.pop('since')
-            if not limit:
-                parameters.pop('limit')
-            if not params:
-                parameters.pop('params')
-            
-            raw_trades = self.client.fetch_trades(**parameters)
-            return ccxt_trades_to_pydantic(raw_trades)
+            raw_trades = self._call('fetch_trades', **self._kw(symbol=symbol, since=since, limit=limit, params=params))
+            return ccxt_trades_to_pydantic(raw_trades, keep_raw=keep_raw)
         except Exception as e:
             self.logger.error(f"Error fetching trades for {symbol}: {e}", exc_info=True)
         return []
     
+    async def fetch_ohlcv_async(
+        self,
+        symbol: str,
+        timeframe: str = config_market.DEFAULT_TIMEFRAME,
+        since: Optional[int] = None,
+        limit: Optional[int] = config_market.DEFAULT_OHLCV_LIMIT,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[OHLCV]:
+        self.logger.debug("Fetching OHLCV (async) for %s on timeframe %s with limit %s", symbol, timeframe, limit)
+        try:
+            raw_ohlcv = await self._call_async('fetch_ohlcv', symbol, timeframe, since, limit, params or {})
+            return ccxt_ohlcv_to_pydantic(raw_ohlcv, symbol, timeframe)
+        except ccxt.NetworkError as e:
+            self.logger.error(f"CCXT NetworkError fetching OHLCV for {symbol}: {e}")
+        except ccxt.ExchangeError as e:
+            self.logger.error(f"CCXT ExchangeError fetching OHLCV for {symbol}: {e}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching OHLCV for {symbol}: {e}", exc_info=True)
+        return []
+
+    async def fetch_ticker_async(self, symbol: str, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Optional[Ticker]:
+        self.logger.debug("Fetching ticker (async) for %s", symbol)
+        try:
+            raw_ticker = await self._call_async('fetch_ticker', symbol, params or {})
+            return ccxt_ticker_to_pydantic(raw_ticker, keep_raw=keep_raw)
+        except Exception as e:
+            self.logger.error(f"Error fetching ticker for {symbol}: {e}", exc_info=True)
+        return None
+
+    async def fetch_tickers_async(self, symbols: Optional[List[str]] = None, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Dict[str, Ticker]:
+        self.logger.debug("Fetching tickers (async) for %s", symbols if symbols else 'all available')
+        tickers_dict: Dict[str, Ticker] = {}
+        try:
+            raw_tickers = await self._call_async('fetch_tickers', symbols, params or {}, weight=_tickers_weight(symbols))
+            return ccxt_tickers_to_pydantic(raw_tickers, keep_raw=keep_raw)
+        except Exception as e:
+            self.logger.error(f"Error fetching tickers for {symbols}: {e}", exc_info=True)
+        return tickers_dict
+
+    async def fetch_tickers_batched_async(self, symbols: List[str], chunk_size: int = config_market.TICKERS_BATCH_SIZE, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Dict[str, Ticker]:
+        """Async fetch_tickers_batched: the per-chunk requests are gathered concurrently."""
+        known_symbols = await asyncio.to_thread(self._known_symbols, symbols) # May (re)load markets over HTTP
+        results = await asyncio.gather(*(
+            self.fetch_tickers_async(chunk, params=params, keep_raw=keep_raw) for chunk in chunked(known_symbols, chunk_size)
+        ))
+        tickers_dict: Dict[str, Ticker] = {}
+        for chunk_tickers in results:
+            tickers_dict.update(chunk_tickers)
+        return tickers_dict
+
+    async def fetch_order_book_async(self, symbol: str, limit: Optional[int] = config_market.DEFAULT_ORDER_BOOK_LIMIT, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> Optional[OrderBook]:
+        self.logger.debug("Fetching order book (async) for %s with limit %s", symbol, limit)
+        try:
+            raw_ob = await self._call_async('fetch_order_book', symbol, limit, params or {}, weight=_order_book_weight(limit))
+            return ccxt_order_book_to_pydantic(raw_ob, keep_raw=keep_raw)
+        except Exception as e:
+            self.logger.error(f"Error fetching order book for {symbol}: {e}", exc_info=True)
+        return None
+
+    async def fetch_trades_async(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = 25, params: Optional[Dict[str, Any]] = None, keep_raw: Optional[bool] = None) -> List[Trade]:
+        self.logger.debug("Fetching trades (async) for %s with limit %s", symbol, limit)
+        try:
+            raw_trades = await self._call_async('fetch_trades', symbol, since, limit, params or {})
+            return ccxt_trades_to_pydantic(raw_trades, keep_raw=keep_raw)
+        except Exception as e:
+            self.logger.error(f"Error fetching trades for {symbol}: {e}", exc_info=True)
+        return []
+
     def place_order(self, symbol, order_type, side, amount, price=None, params=None):
         """
         Places an order on Binance.
@@ -187,11 +427,11 @@ class BinanceSource(BaseMarketDataSource):
         :return: Order info dict or None
         """
         try:
-            self.logger.debug(f"Placing {order_type} {side} order for {amount} {symbol} at {price}")
+            self.logger.debug("Placing %s %s order for %s %s at %s", order_type, side, amount, symbol, price)
             if order_type == 'limit':
-                order = self.client.create_order(symbol, order_type, side, amount, price, params or {})
+                order = self._call('create_order', symbol, order_type, side, amount, price, params or {})
             else:
-                order = self.client.create_order(symbol, order_type, side, amount, None, params or {})
+                order = self._call('create_order', symbol, order_type, side, amount, None, params or {})
             return order
         except Exception as e:
             self.logger.error(f"Error placing order: {e}", exc_info=True)
@@ -208,8 +448,8 @@ class BinanceSource(BaseMarketDataSource):
         try:
             if not symbol:
                 raise ValueError("Symbol is required to cancel an order on Binance.")
-            self.logger.debug(f"Cancelling order {order_id} for {symbol}")
-            result = self.client.cancel_order(order_id, symbol, params or {})
+            self.logger.debug("Cancelling order %s for %s", order_id, symbol)
+            result = self._call('cancel_order', order_id, symbol, params or {}, critical=True) # May use the reserved budget
             return result
         except Exception as e:
             self.logger.error(f"Error cancelling order: {e}", exc_info=True)
@@ -226,8 +466,8 @@ class BinanceSource(BaseMarketDataSource):
         try:
             if not symbol:
                 raise ValueError("Symbol is required to get order status on Binance.")
-            self.logger.debug(f"Fetching order status for {order_id} on {symbol}")
-            order = self.client.fetch_order(order_id, symbol, params or {})
+            self.logger.debug("Fetching order status for %s on %s", order_id, symbol)
+            order = self._call('fetch_order', order_id, symbol, params or {})
             return order
         except Exception as e:
             self.logger.error(f"Error fetching order status: {e}", exc_info=True)
@@ -241,8 +481,8 @@ class BinanceSource(BaseMarketDataSource):
         :return: List of open orders
         """
         try:
-            self.logger.debug(f"Fetching open orders for {symbol if symbol else 'all symbols'}")
-            orders = self.client.fetch_open_orders(symbol, params or {}) if symbol else self.client.fetch_open_orders(None, params or {})
+            self.logger.debug("Fetching open orders for %s", symbol if symbol else 'all symbols')
+            orders = self._call('fetch_open_orders', symbol, params or {}, weight=None if symbol else 80)
             return orders
         except Exception as e:
             self.logger.error(f"Error fetching open orders: {e}", exc_info=True)
@@ -256,22 +496,26 @@ class BinanceSource(BaseMarketDataSource):
         """
         try:
             self.logger.debug("Fetching account balance")
-            balance = self.client.fetch_balance(params or {})
+            balance = self._call('fetch_balance', params or {})
             return balance
         except Exception as e:
             self.logger.error(f"Error fetching account balance: {e}", exc_info=True)
             return None
 
-    def get_current_price(self, symbol, params=None):
+    def get_current_price(self, symbol: Union[str, List[str]], params=None):
         """
-        Gets the current price for a symbol.
-        :param symbol: Trading pair symbol
+        Gets the current price for a symbol, or for several symbols in batched requests.
+        :param symbol: Trading pair symbol, or a list of symbols
         :param params: Additional params for CCXT
-        :return: Price (float) or None
+        :return: Price (float) or None; for a list, a dict of symbol -> price (missing symbols omitted)
         """
+        if isinstance(symbol, list):
+            self.logger.debug("Fetching current prices for %s symbols", len(symbol))
+            tickers = self.fetch_tickers_batched(symbol, params=params)
+            return {sym: ticker.last for sym, ticker in tickers.items()}
         try:
-            self.logger.info(f"Fetching current price for {symbol}")
-            ticker = self.client.fetch_ticker(symbol, params or {})
+            self.logger.debug("Fetching current price for %s", symbol) # Hot path: keep out of INFO logs
+            ticker = self._call('fetch_ticker', symbol, params or {})
             return ticker.get('last')
         except Exception as e:
             self.logger.error(f"Error fetching current price: {e}", exc_info=True)
@@ -288,8 +532,8 @@ class BinanceSource(BaseMarketDataSource):
         :return: List of OHLCV data
         """
         try:
-            self.logger.debug(f"Fetching historical data for {symbol} timeframe {timeframe}")
-            ohlcv = self.client.fetch_ohlcv(symbol, timeframe, since, limit, params or {})
+            self.logger.debug("Fetching historical data for %s timeframe %s", symbol, timeframe)
+            ohlcv = self._call('fetch_ohlcv', symbol, timeframe, since, limit, params or {})
             return ccxt_ohlcv_to_pydantic(ohlcv, symbol, timeframe)
         except Exception as e:
             self.logger.error(f"Error fetching historical data: {e}", exc_info=True)
@@ -303,9 +547,10 @@ class BinanceSource(BaseMarketDataSource):
         :return: Symbol info dict or None
         """
         try:
-            self.logger.debug(f"Fetching symbol info for {symbol}")
-            markets = self.client.load_markets(params or {})
-            return markets.get(symbol)
+            self.logger.debug("Fetching symbol info for %s", symbol)
+            if params: # Explicit params force a fresh load_markets call
+                return self._call('load_markets', True, params).get(symbol)
+            return self._get_market(symbol)
         except Exception as e:
             self.logger.error(f"Error fetching symbol info: {e}", exc_info=True)
             return None
@@ -318,8 +563,9 @@ class BinanceSource(BaseMarketDataSource):
         """
         try:
             self.logger.debug("Fetching all available symbols")
-            markets = self.client.load_markets(params or {})
-            return list(markets.keys())
+            if params: # Explicit params force a fresh load_markets call
+                return list(self._call('load_markets', True, params).keys())
+            return list(self._get_markets().keys())
         except Exception as e:
             self.logger.error(f"Error fetching all symbols: {e}", exc_info=True)
             return []
\ No newline at end of file
@@ -4,6 +4,8 @@
 # or if inside the package: python main_market_data.py (after adjusting imports)
 
 # For running as `python -m crypto_market_data_fetcher.main_market_data`
+import asyncio
+import logging
 from .data_sources.binance_source import BinanceSource
 from . import config_market # Import the market-specific config
 from .utils.market_helpers import logger # Use the shared logger
@@ -13,13 +15,21 @@ from .utils.market_helpers import logger # Use the shared logger
 # or keep them relative if the execution context allows.
 # For simplicity with `-m` execution, the relative imports above are preferred.
 
+async def fetch_tickers_batched(source: BinanceSource, symbols):
+    """Fetches tickers for all symbols in batched requests, then releases the async client."""
+    try:
+        return await source.fetch_tickers_batched_async(symbols)
+    finally:
+        await source.close()
+
 def run_fetches():
     logger.info("Starting Market Data Fetcher Example...")
 
     # Initialize Binance source
     # API keys can be passed here or will be picked from config_market.py / .env
     binance = BinanceSource()
-    binance.check_exchange_capabilities() # Good to see what's available
+    if config_market.VERBOSE_STARTUP:
+        binance.check_exchange_capabilities() # Good to see what's available
 
     target_symbol = "BTC/USDT"
     alt_symbol = "ETH/USDT"
@@ -43,8 +53,9 @@ def run_fetches():
     ticker_data = binance.fetch_ticker(symbol=alt_symbol)
     if ticker_data:
         logger.info(f"Ticker for {alt_symbol}: Last Price: {ticker_data.last}, Bid: {ticker_data.bid}, Ask: {ticker_data.ask}")
-        logger.debug(f"Full Ticker data: {ticker_data.model_dump_json(indent=2)}") # Pydantic v2
-        # For Pydantic v1: logger.debug(f"Full Ticker data: {ticker_data.json(indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG): # Only pay for serialization when it will be logged
+            logger.debug("Full Ticker data: %s", ticker_data.model_dump_json(indent=2)) # Pydantic v2
+        # For Pydantic v1: logger.debug("Full Ticker data: %s", ticker_data.json(indent=2))
     else:
         logger.warning(f"No Ticker data returned for {alt_symbol}.")
 
@@ -66,12 +77,13 @@ def run_fetches():
     if order_book_data:
         logger.info(f"Order Book for {target_symbol} (Top 2 bids/asks):")
         logger.info(f"  Bids:")
-        for bid in order_book_data.bids[:2]:
-            logger.info(f"    Price: {bid.price}, Amount: {bid.amount}")
+        for price, amount in order_book_data.bids[:2]:
+            logger.info(f"    Price: {price}, Amount: {amount}")
         logger.info(f"  Asks:")
-        for ask in order_book_data.asks[:2]:
-            logger.info(f"    Price: {ask.price}, Amount: {ask.amount}")
-        logger.debug(f"Full Order Book data: {order_book_data.model_dump_json(indent=2)}") # Pydantic v2
+        for price, amount in order_book_data.asks[:2]:
+            logger.info(f"    Price: {price}, Amount: {amount}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full Order Book data: %s", order_book_data.model_dump_json(indent=2)) # Pydantic v2
     else:
         logger.warning(f"No Order Book data returned for {target_symbol}.")
 
@@ -87,6 +99,13 @@ def run_fetches():
         logger.warning(f"No trades data returned for {alt_symbol}.")
 
 
+    # --- Fetch Tickers in Batches (async) ---
+    logger.info(f"\n--- Fetching Tickers in Batches for {config_market.DEFAULT_SYMBOLS} ---")
+    batched_tickers = asyncio.run(fetch_tickers_batched(binance, config_market.DEFAULT_SYMBOLS))
+    for sym, tick_data in batched_tickers.items():
+        logger.info(f"  {sym}: Last Price: {tick_data.last}")
+
+
     logger.info("\nMarket Data Fetcher Example Finished.")
 
 if __name__ == "__main__":
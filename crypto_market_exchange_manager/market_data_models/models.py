@@ -1,9 +1,17 @@
 # crypto_market_data_fetcher/market_data_models/models.py
-from pydantic import BaseModel, Field, validator
+from dataclasses import dataclass
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, validator
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Shared config for the hot-path market types: instances are immutable snapshots,
+# so skip assignment validation and ignore unknown keys instead of storing them.
+HOT_PATH_MODEL_CONFIG = ConfigDict(frozen=True, extra='ignore', populate_by_name=True, validate_assignment=False)
 
 class OHLCV(BaseModel):
+    model_config = HOT_PATH_MODEL_CONFIG
+
     timestamp: datetime
     open: float
     high: float
@@ -21,7 +29,62 @@ class OHLCV(BaseModel):
             return datetime.fromisoformat(value.replace('Z', '+00:00'))
         return value # Already a datetime object
 
+@dataclass(frozen=True)
+class OHLCVFrame:
+    """
+    Columnar OHLCV candles: one numpy array per field instead of one OHLCV model per candle,
+    so indicators (rolling means, EMAs, RSI) run as vectorized numpy/pandas operations.
+    """
+    symbol: str # e.g., BTC/USDT
+    timeframe: str # e.g., 1h
+    timestamp: np.ndarray # int64, milliseconds since epoch (UTC)
+    open: np.ndarray # float64
+    high: np.ndarray # float64
+    low: np.ndarray # float64
+    close: np.ndarray # float64
+    volume: np.ndarray # float64
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_candles(cls, candles: np.ndarray, symbol: str, timeframe: str) -> "OHLCVFrame":
+        """Builds a frame from a float64 (N, 6) array of [timestamp_ms, open, high, low, close, volume] rows."""
+        candles = np.asarray(candles, dtype=np.float64).reshape(-1, 6)
+        return cls(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=candles[:, 0].astype(np.int64),
+            open=candles[:, 1],
+            high=candles[:, 2],
+            low=candles[:, 3],
+            close=candles[:, 4],
+            volume=candles[:, 5],
+        )
+
+    @classmethod
+    def from_ohlcv(cls, ohlcv_list: List[OHLCV], symbol: str, timeframe: str) -> "OHLCVFrame":
+        """Builds a frame from OHLCV models, for sources that only produce the list form."""
+        candles = [
+            ((o.timestamp if o.timestamp.tzinfo else o.timestamp.replace(tzinfo=timezone.utc)).timestamp() * 1000,
+             o.open, o.high, o.low, o.close, o.volume)
+            for o in ohlcv_list
+        ]
+        return cls.from_candles(np.array(candles, dtype=np.float64), symbol, timeframe)
+
+    def to_ohlcv_list(self) -> List[OHLCV]:
+        """Converts back to OHLCV models, for callers that need the per-candle objects."""
+        return [
+            OHLCV(timestamp=ts, open=o, high=h, low=l, close=c, volume=v, symbol=self.symbol, timeframe=self.timeframe)
+            for ts, o, h, l, c, v in zip(
+                self.timestamp.tolist(), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist()
+            )
+        ]
+
 class Ticker(BaseModel):
+    model_config = HOT_PATH_MODEL_CONFIG
+
     symbol: str  # e.g., BTC/USDT
     timestamp: datetime # When the ticker data was fetched/generated
     last: float      # Last traded price
@@ -37,7 +100,7 @@ class Ticker(BaseModel):
     change: Optional[float] = None # Absolute price change in 24h
     percentage: Optional[float] = None # Percentage price change in 24h
     average: Optional[float] = None # Average price in 24h
-    info: Dict[str, Any] = Field(default_factory=dict) # Raw exchange response
+    info: Dict[str, Any] = Field(default_factory=dict, repr=False, exclude=True) # Raw exchange response, only kept when requested
 
     @validator('timestamp', pre=True)
     def convert_ticker_timestamp(cls, value):
@@ -48,16 +111,62 @@ class Ticker(BaseModel):
         return value
 
 class OrderBookEntry(BaseModel):
+    model_config = HOT_PATH_MODEL_CONFIG
+
     price: float
     amount: float # Amount in base currency
 
+def _as_levels(value: Any) -> np.ndarray:
+    """Coerces order book levels to a float64 array of shape (N, 2) holding (price, amount) rows."""
+    if isinstance(value, np.ndarray) and value.dtype == np.float64 and value.ndim == 2 and value.shape[1] == 2:
+        return value
+    if value is None or len(value) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    try:
+        levels = np.asarray(value, dtype=np.float64)
+    except ValueError: # Ragged rows, e.g. ccxt appending an order count to some levels only
+        levels = np.array([(level[0], level[1]) for level in value], dtype=np.float64)
+    if levels.ndim != 2 or levels.shape[1] < 2:
+        raise ValueError(f"Order book levels must be (price, amount) rows, got shape {levels.shape}")
+    return levels[:, :2] if levels.shape[1] > 2 else levels
+
 class OrderBook(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     symbol: str
     timestamp: Optional[datetime] = None # When the order book was fetched/generated 
-    bids: List[OrderBookEntry] # Highest bids first
-    asks: List[OrderBookEntry] # Lowest asks first
+    bids: np.ndarray # float64 (N, 2) array of (price, amount) rows, highest bids first
+    asks: np.ndarray # float64 (N, 2) array of (price, amount) rows, lowest asks first
     nonce: Optional[int] = None # Optional sequence number
-    info: Dict[str, Any] = Field(default_factory=dict) # Raw exchange response
+    info: Dict[str, Any] = Field(default_factory=dict, repr=False, exclude=True) # Raw exchange response, only kept when requested
+
+    @property
+    def bids_as_entries(self) -> List[OrderBookEntry]:
+        """Bids as OrderBookEntry models, for callers that predate the array representation."""
+        return [OrderBookEntry(price=price, amount=amount) for price, amount in self.bids.tolist()]
+
+    @property
+    def asks_as_entries(self) -> List[OrderBookEntry]:
+        """Asks as OrderBookEntry models, for callers that predate the array representation."""
+        return [OrderBookEntry(price=price, amount=amount) for price, amount in self.asks.tolist()]
+
+    def __eq__(self, other: Any) -> bool:
+        # BaseModel's field-by-field == would evaluate the truth value of whole arrays and raise
+        if not isinstance(other, OrderBook):
+            return NotImplemented
+        return (
+            (self.symbol, self.timestamp, self.nonce, self.info) == (other.symbol, other.timestamp, other.nonce, other.info)
+            and np.array_equal(self.bids, other.bids)
+            and np.array_equal(self.asks, other.asks)
+        )
+
+    @validator('bids', 'asks', pre=True)
+    def convert_levels_to_array(cls, value):
+        return _as_levels(value)
+
+    @field_serializer('bids', 'asks')
+    def serialize_levels(self, levels: np.ndarray) -> List[List[float]]:
+        return levels.tolist()
 
     @validator('timestamp', pre=True)
     def convert_orderbook_timestamp(cls, value):
@@ -68,6 +177,8 @@ class OrderBook(BaseModel):
         return value
 
 class Trade(BaseModel):
+    model_config = HOT_PATH_MODEL_CONFIG
+
     id: str
     timestamp: datetime
     symbol: str
@@ -77,7 +188,7 @@ class Trade(BaseModel):
     cost: Optional[float] = None # Amount in quote currency (price * amount)
     takerOrMaker: Optional[str] = None # 'taker' or 'maker'
     fee: Optional[Dict[str, Any]] = None
-    info: Dict[str, Any] = Field(default_factory=dict)
+    info: Dict[str, Any] = Field(default_factory=dict, repr=False, exclude=True) # Raw exchange response, only kept when requested
 
     @validator('timestamp', pre=True)
     def convert_trade_timestamp(cls, value):
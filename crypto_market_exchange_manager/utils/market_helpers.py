@@ -1,9 +1,16 @@
 # crypto_market_data_fetcher/utils/market_helpers.py
 import logging
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Any, Dict, Optional
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
 import ccxt # For type hinting if used, or just for general knowledge
+from .. import config_market
 
+@lru_cache(maxsize=None)
 def setup_market_logging(level=logging.INFO):
+    """Returns the shared market logger. Cached, so repeat calls don't re-run logging.basicConfig."""
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(levelname)s - %(module)s.%(funcName)s - %(message)s",
@@ -22,9 +29,37 @@ def format_symbol_for_exchange(symbol: str, exchange_name: str) -> str:
         return symbol.replace("/", "")
     return symbol # CCXT generally handles standard 'BASE/QUOTE' format
 
+@lru_cache(maxsize=None)
+def _type_adapter(tp: Any) -> TypeAdapter:
+    """Returns a cached TypeAdapter so the validation schema is built once per type, not per call."""
+    return TypeAdapter(tp)
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Splits a list into consecutive chunks of at most `size` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
 def ccxt_ohlcv_to_pydantic(ccxt_ohlcv: List[List[Any]], symbol: str, timeframe: str) -> List["OHLCV"]: # type: ignore
     """Converts CCXT OHLCV list to a list of Pydantic OHLCV models."""
     from ..market_data_models.models import OHLCV # Local import to avoid circular dependency
+    if not ccxt_ohlcv:
+        return []
+    try:
+        # Convert all candles in one shot; ccxt may append extra columns, only the first six are OHLCV
+        candles = np.asarray(ccxt_ohlcv, dtype=np.float64)[:, :6]
+    except (TypeError, ValueError, IndexError):
+        candles = None
+    if candles is not None and candles.shape[1] == 6 and not np.isnan(candles).any():
+        # Types are already known here, so skip per-field validation via model_construct.
+        # The timestamp validator does not run either, so convert ms -> datetime here.
+        timestamps = [datetime.utcfromtimestamp(ms / 1000) for ms in candles[:, 0].astype(np.int64).tolist()]
+        opens, highs, lows, closes, volumes = candles[:, 1:6].T.tolist()
+        construct = OHLCV.model_construct
+        return [
+            construct(timestamp=ts, open=o, high=h, low=l, close=c, volume=v, symbol=symbol, timeframe=timeframe)
+            for ts, o, h, l, c, v in zip(timestamps, opens, highs, lows, closes, volumes)
+        ]
+
+    # Slow path for ragged or incomplete candles: validate row by row and skip the bad ones
     ohlcv_list = []
     for candle in ccxt_ohlcv:
         try:
@@ -44,76 +79,131 @@ def ccxt_ohlcv_to_pydantic(ccxt_ohlcv: List[List[Any]], symbol: str, timeframe:
             logger.error(f"Error converting CCXT candle to Pydantic OHLCV for {symbol} @ {timeframe}: {candle} - Error: {e}")
     return ohlcv_list
 
-def ccxt_ticker_to_pydantic(ccxt_ticker: Dict[str, Any]) -> Optional["Ticker"]: # type: ignore
+def ccxt_ohlcv_to_frame(ccxt_ohlcv: List[List[Any]], symbol: str, timeframe: str) -> "OHLCVFrame": # type: ignore
+    """Converts CCXT OHLCV list to a columnar OHLCVFrame, skipping incomplete candles."""
+    from ..market_data_models.models import OHLCVFrame # Local import to avoid circular dependency
+    if not ccxt_ohlcv:
+        return OHLCVFrame.from_candles(np.empty((0, 6)), symbol, timeframe)
+    try:
+        # ccxt may append extra columns, only the first six are OHLCV
+        candles = np.asarray(ccxt_ohlcv, dtype=np.float64)[:, :6]
+    except (TypeError, ValueError, IndexError):
+        candles = None
+    if candles is None or candles.shape[1] < 6:
+        # Ragged rows or None fields: convert row by row and drop the candles that don't fit
+        rows = []
+        for candle in ccxt_ohlcv:
+            try:
+                rows.append([float(value) for value in candle[:6]])
+            except (TypeError, ValueError):
+                continue
+        candles = np.array([row for row in rows if len(row) == 6], dtype=np.float64).reshape(-1, 6)
+    return OHLCVFrame.from_candles(candles[~np.isnan(candles).any(axis=1)], symbol, timeframe)
+
+def _keep_raw_info(keep_raw: Optional[bool]) -> bool:
+    """Resolves the per-call keep_raw flag against config_market.KEEP_RAW_INFO."""
+    return config_market.KEEP_RAW_INFO if keep_raw is None else keep_raw
+
+def _ccxt_ticker_fields(ccxt_ticker: Dict[str, Any], keep_raw: bool) -> Dict[str, Any]:
+    """Maps a CCXT ticker dictionary onto Ticker field names."""
+    return {
+        'symbol': ccxt_ticker.get('symbol'),
+        'timestamp': ccxt_ticker.get('timestamp') or ccxt_ticker.get('datetime'), # CCXT uses timestamp or datetime
+        'last': ccxt_ticker.get('last'),
+        'open': ccxt_ticker.get('open'),
+        'high': ccxt_ticker.get('high'),
+        'low': ccxt_ticker.get('low'),
+        'close': ccxt_ticker.get('close'),
+        'bid': ccxt_ticker.get('bid'),
+        'ask': ccxt_ticker.get('ask'),
+        'volume': ccxt_ticker.get('baseVolume'), # CCXT uses baseVolume
+        'quoteVolume': ccxt_ticker.get('quoteVolume'),
+        'vwap': ccxt_ticker.get('vwap'),
+        'change': ccxt_ticker.get('change'),
+        'percentage': ccxt_ticker.get('percentage'),
+        'average': ccxt_ticker.get('average'),
+        'info': ccxt_ticker.get('info', {}) if keep_raw else {}
+    }
+
+def ccxt_ticker_to_pydantic(ccxt_ticker: Dict[str, Any], keep_raw: Optional[bool] = None) -> Optional["Ticker"]: # type: ignore
     """Converts a CCXT ticker dictionary to a Pydantic Ticker model."""
     from ..market_data_models.models import Ticker # Local import
     if not ccxt_ticker:
         return None
     try:
-        return Ticker(
-            symbol=ccxt_ticker.get('symbol'),
-            timestamp=ccxt_ticker.get('timestamp') or ccxt_ticker.get('datetime'), # CCXT uses timestamp or datetime
-            last=ccxt_ticker.get('last'),
-            open=ccxt_ticker.get('open'),
-            high=ccxt_ticker.get('high'),
-            low=ccxt_ticker.get('low'),
-            close=ccxt_ticker.get('close'),
-            bid=ccxt_ticker.get('bid'),
-            ask=ccxt_ticker.get('ask'),
-            volume=ccxt_ticker.get('baseVolume'), # CCXT uses baseVolume
-            quoteVolume=ccxt_ticker.get('quoteVolume'),
-            vwap=ccxt_ticker.get('vwap'),
-            change=ccxt_ticker.get('change'),
-            percentage=ccxt_ticker.get('percentage'),
-            average=ccxt_ticker.get('average'),
-            info=ccxt_ticker.get('info', {})
-        )
+        return Ticker(**_ccxt_ticker_fields(ccxt_ticker, _keep_raw_info(keep_raw)))
     except Exception as e:
         logger.error(f"Error converting CCXT ticker to Pydantic Ticker for {ccxt_ticker.get('symbol')}: {e} - Data: {ccxt_ticker}")
         return None
 
-def ccxt_order_book_to_pydantic(ccxt_ob: Dict[str, Any]) -> Optional["OrderBook"]: # type: ignore
+def ccxt_tickers_to_pydantic(ccxt_tickers: Dict[str, Dict[str, Any]], keep_raw: Optional[bool] = None) -> Dict[str, "Ticker"]: # type: ignore
+    """Converts a CCXT fetch_tickers result (symbol -> ticker dict) to Pydantic Ticker models in one validation pass."""
+    from ..market_data_models.models import Ticker # Local import
+    if not ccxt_tickers:
+        return {}
+    keep_raw = _keep_raw_info(keep_raw)
+    items = {symbol: _ccxt_ticker_fields(raw, keep_raw) for symbol, raw in ccxt_tickers.items() if raw}
+    try:
+        return _type_adapter(Dict[str, Ticker]).validate_python(items)
+    except ValidationError:
+        pass # At least one ticker is invalid (e.g. no last price); convert one by one so only the bad ones are dropped
+    tickers = {}
+    for symbol, fields in items.items():
+        try:
+            tickers[symbol] = Ticker(**fields)
+        except Exception as e:
+            logger.error(f"Error converting CCXT ticker to Pydantic Ticker for {symbol}: {e} - Data: {ccxt_tickers[symbol]}")
+    return tickers
+
+def ccxt_order_book_to_pydantic(ccxt_ob: Dict[str, Any], keep_raw: Optional[bool] = None) -> Optional["OrderBook"]: # type: ignore
     """Converts CCXT order book to Pydantic OrderBook model."""
-    from ..market_data_models.models import OrderBook, OrderBookEntry # Local import
+    from ..market_data_models.models import OrderBook # Local import
     if not ccxt_ob:
         return None
     try:
-        bids = [OrderBookEntry(price=float(bid[0]), amount=float(bid[1])) for bid in ccxt_ob.get('bids', [])]
-        asks = [OrderBookEntry(price=float(ask[0]), amount=float(ask[1])) for ask in ccxt_ob.get('asks', [])]
+        # Levels become float64 (N, 2) arrays in the model validator; no Python object per level
         return OrderBook(
             symbol=ccxt_ob.get('symbol'),
             timestamp=ccxt_ob.get('timestamp') or ccxt_ob.get('datetime'),
-            bids=bids,
-            asks=asks,
+            bids=ccxt_ob.get('bids', []),
+            asks=ccxt_ob.get('asks', []),
             nonce=ccxt_ob.get('nonce'),
-            info=ccxt_ob.get('info', {})
+            info=ccxt_ob.get('info', {}) if _keep_raw_info(keep_raw) else {}
         )
     except Exception as e:
         logger.error(f"Error converting CCXT order book to Pydantic for {ccxt_ob.get('symbol')}: {e} - Data: {ccxt_ob}")
         return None
 
-def ccxt_trades_to_pydantic(ccxt_trades: List[Dict[str, Any]]) -> List["Trade"]: # type: ignore
+def _ccxt_trade_fields(trade_data: Dict[str, Any], keep_raw: bool) -> Dict[str, Any]:
+    """Maps a CCXT trade dictionary onto Trade field names. Pydantic coerces numeric strings."""
+    return {
+        'id': str(trade_data.get('id')),
+        'timestamp': trade_data.get('timestamp') or trade_data.get('datetime'),
+        'symbol': trade_data.get('symbol'),
+        'side': trade_data.get('side'),
+        'price': trade_data.get('price'),
+        'amount': trade_data.get('amount'),
+        'cost': trade_data.get('cost'),
+        'takerOrMaker': trade_data.get('takerOrMaker'),
+        'fee': trade_data.get('fee'),
+        'info': trade_data.get('info', {}) if keep_raw else {}
+    }
+
+def ccxt_trades_to_pydantic(ccxt_trades: List[Dict[str, Any]], keep_raw: Optional[bool] = None) -> List["Trade"]: # type: ignore
     """Converts a list of CCXT trade dictionaries to Pydantic Trade models."""
     from ..market_data_models.models import Trade # Local import
-    trades_list = []
     if not ccxt_trades:
-        return trades_list
-    for trade_data in ccxt_trades:
+        return []
+    keep_raw = _keep_raw_info(keep_raw)
+    items = [_ccxt_trade_fields(trade_data, keep_raw) for trade_data in ccxt_trades]
+    try:
+        return _type_adapter(List[Trade]).validate_python(items)
+    except ValidationError:
+        pass # Fall back to per-trade conversion so only the invalid trades are dropped
+    trades_list = []
+    for trade_data, fields in zip(ccxt_trades, items):
         try:
-            trades_list.append(
-                Trade(
-                    id=str(trade_data.get('id')),
-                    timestamp=trade_data.get('timestamp') or trade_data.get('datetime'),
-                    symbol=trade_data.get('symbol'),
-                    side=trade_data.get('side'),
-                    price=float(trade_data.get('price')),
-                    amount=float(trade_data.get('amount')),
-                    cost=trade_data.get('cost'),
-                    takerOrMaker=trade_data.get('takerOrMaker'),
-                    fee=trade_data.get('fee'),
-                    info=trade_data.get('info', {})
-                )
-            )
+            trades_list.append(Trade(**fields))
         except Exception as e:
             logger.error(f"Error converting CCXT trade to Pydantic for {trade_data.get('symbol')}: {e} - Data: {trade_data}")
-    return trades_list
\ No newline at end of file
+    return trades_list
@@ -0,0 +1,84 @@
+# crypto_market_data_fetcher/utils/rate_limiter.py
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Mapping, Optional, Tuple
+
+class WeightRateLimiter:
+    """
+    Client-side request-weight budget for exchanges that meter usage per minute (e.g. Binance's
+    1200 weight/min per IP). Callers acquire an endpoint's weight before each request and block
+    only when the budget is exhausted, instead of sleeping a fixed interval before every call.
+
+    A share of the budget is reserved for critical calls (order cancels), so safety operations
+    still go through when regular traffic has used up its part. After each response the local
+    estimate is recalibrated from the exchange's reported usage header.
+    """
+
+    def __init__(
+        self,
+        max_weight: int = 1200,
+        reserve_ratio: float = 0.1,
+        window_seconds: float = 60.0,
+        used_weight_header: str = "X-MBX-USED-WEIGHT-1M"
+    ):
+        self.max_weight = max_weight
+        self.reserved_weight = int(max_weight * reserve_ratio)
+        self.window_seconds = window_seconds
+        self.used_weight_header = used_weight_header
+        self._lock = threading.Lock() # Guards the state below; shared by sync and async callers
+        self._events: Deque[Tuple[float, int]] = deque() # (monotonic time, weight) spent in the window
+        self._used = 0
+        self._server_used = 0 # Last usage reported by the exchange for its current window
+        self._server_window = -1 # Wall-clock window index the reported usage belongs to
+
+    def _try_acquire(self, weight: int, critical: bool) -> float:
+        """Takes `weight` from the budget and returns 0, or returns the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            while self._events and now - self._events[0][0] >= self.window_seconds:
+                self._used -= self._events.popleft()[1]
+
+            wall_now = time.time()
+            server_used = self._server_used if int(wall_now // self.window_seconds) == self._server_window else 0
+            used = max(self._used, server_used)
+            limit = self.max_weight if critical else self.max_weight - self.reserved_weight
+
+            # A request heavier than the whole budget is let through once the window is empty
+            if used + weight <= limit or used == 0:
+                self._events.append((now, weight))
+                self._used += weight
+                return 0.0
+
+            waits = []
+            if self._used >= server_used and self._events:
+                waits.append(self.window_seconds - (now - self._events[0][0]))
+            if server_used > self._used:
+                waits.append(self.window_seconds - wall_now % self.window_seconds) # Exchange window resets on the boundary
+            return max(min(waits, default=0.05), 0.05)
+
+    def acquire(self, weight: int = 1, critical: bool = False) -> None:
+        """Blocks the calling thread until `weight` fits in the budget."""
+        while (wait := self._try_acquire(weight, critical)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, weight: int = 1, critical: bool = False) -> None:
+        """Waits without blocking the event loop until `weight` fits in the budget."""
+        while (wait := self._try_acquire(weight, critical)) > 0:
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: Optional[Mapping[str, Any]]) -> None:
+        """Recalibrates the budget from the exchange-reported used weight, if the header is present."""
+        if not headers:
+            return
+        value = headers.get(self.used_weight_header) or headers.get(self.used_weight_header.lower())
+        if value is None:
+            return
+        try:
+            used = int(value)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._server_used = used
+            self._server_window = int(time.time() // self.window_seconds)
@@ -2,6 +2,8 @@
 import os
 from dotenv import load_dotenv
 
+from .utils.helpers import build_keyword_automaton
+
 load_dotenv()
 
 # API Keys
@@ -18,6 +20,9 @@ TARGET_COINS = {
     # Add more coins as needed
 }
 
+# Built once at load; news sources use it whenever they are asked to match TARGET_COINS
+KEYWORD_AUTOMATON = build_keyword_automaton(TARGET_COINS)
+
 # RSS Feeds
 # Structure: "Source Name": "URL"
 RSS_FEEDS_CONFIG = {
@@ -25,6 +30,7 @@ RSS_FEEDS_CONFIG = {
     "CoinTelegraph": "https://cointelegraph.com/rss",
     "BitcoinMagazine": "https://bitcoinmagazine.com/feed",
 }
+RSS_CACHE_DIR = os.path.expanduser("~/.cache/ctb/rss") # Feed validators and entries for conditional GETs (needs diskcache)
 
 # NewsAPI settings
 NEWSAPI_DAYS_AGO = 3 # How many days back to fetch news from NewsAPI
@@ -37,4 +43,11 @@ CRYPTOPANIC_KIND = "news" # Optional: news|media
 
 # General settings
 MAX_ARTICLES_PER_SOURCE_TYPE = 50 # Max articles to process from each major source type (RSS, NewsAPI, CryptoPanic)
-REQUEST_TIMEOUT = 15 # Seconds
\ No newline at end of file
+REQUEST_TIMEOUT = 15 # Seconds
+MAX_CONCURRENT_SOURCE_REQUESTS = 16 # Max news sources fetched at the same time
+
+# HTTP connection pool for blocking source requests (requests.Session per source)
+HTTP_POOL_CONNECTIONS = 8 # Distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = 32 # Connections kept alive per host
+HTTP_MAX_RETRIES = 2 # Retries on connection errors
+HTTP_RETRY_BACKOFF = 0.3 # Seconds, doubled per retry
\ No newline at end of file
@@ -1,8 +1,11 @@
 # crypto_news_aggregator/main.py
+import asyncio
+import aiohttp
 from typing import List
 from . import config
 from .utils.helpers import setup_logging, deduplicate_articles, sort_articles_by_date
 from .utils.data_models import Article
+from .news_sources.base_source import BaseNewsSource
 from .news_sources.rss_source import RSSSource
 from .news_sources.newsapi_source import NewsApiSource
 from .news_sources.cryptopanic_source import CryptoPanicSource
@@ -11,6 +14,19 @@ from .news_sources.cryptopanic_source import CryptoPanicSource
 
 logger = setup_logging()
 
+async def _fetch_from_sources(sources: List[BaseNewsSource], target_coins_keywords) -> List:
+    """Fetches from all sources concurrently; returns one article list (or exception) per source."""
+    semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_SOURCE_REQUESTS)
+
+    # One connection pool for every source that does native async HTTP
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)) as session:
+        async def fetch(source: BaseNewsSource) -> List[Article]:
+            async with semaphore:
+                logger.info(f"Fetching from source: {source.source_name}")
+                return await source.fetch_news_async(target_coins_keywords, session=session)
+
+        return await asyncio.gather(*(fetch(source) for source in sources), return_exceptions=True)
+
 def get_top_recent_articles(num_articles: int = 10):
     """
     Main function to fetch and process the latest crypto news articles.
@@ -34,16 +50,19 @@ def get_top_recent_articles(num_articles: int = 10):
         logger.warning("No active news sources configured or API keys missing. Exiting.")
         return
 
-    # Fetch news from all active sources
-    for source in active_sources:
-        try:
-            logger.info(f"Fetching from source: {source.source_name}")
-            # Pass the full TARGET_COINS dict to each source; they will filter internally
-            articles = source.fetch_news(config.TARGET_COINS)
-            all_raw_articles.extend(articles)
-            logger.info(f"Fetched {len(articles)} articles from {source.source_name}")
-        except Exception as e:
-            logger.error(f"Failed to fetch news from {source.source_name}: {e}", exc_info=True)
+    # Fetch news from all active sources concurrently
+    # Pass the full TARGET_COINS dict to each source; they will filter internally
+    try:
+        results = asyncio.run(_fetch_from_sources(active_sources, config.TARGET_COINS))
+    finally:
+        for source in active_sources:
+            source.close() # The sources are per run; release any pooled connections
+    for source, articles in zip(active_sources, results):
+        if isinstance(articles, Exception):
+            logger.error(f"Failed to fetch news from {source.source_name}: {articles}", exc_info=articles)
+            continue
+        all_raw_articles.extend(articles)
+        logger.info(f"Fetched {len(articles)} articles from {source.source_name}")
 
 
     logger.info(f"Total articles collected before deduplication: {len(all_raw_articles)}")
@@ -1,14 +1,55 @@
 # crypto_news_aggregator/news_sources/base_source.py
+import asyncio
+import re
+import sys
+import aiohttp
+import requests
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, List, Dict, Optional, Pattern, Set, Tuple, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..utils.data_models import Article
-from ..utils.helpers import logger
+from ..utils.helpers import build_keyword_automaton, logger, parse_iso_datetime
+from .. import config
+
+FrozenTargets = Tuple[Tuple[str, Tuple[str, ...]], ...] # Hashable form of a target_coins_keywords dict
+
+@dataclass(frozen=True)
+class TargetIndex:
+    """Lookup structures derived from one target_coins_keywords dict (see _prepare_targets)."""
+    tickers_csv: str # Target tickers joined by commas, for APIs that filter by currency
+    upper_to_ticker: Dict[str, str] # Uppercased ticker -> target ticker
+    find_coins: Optional[Callable[[str], Set[str]]] # Text -> tickers whose keywords it mentions; None without keywords
 
 class BaseNewsSource(ABC):
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.logger = logger # Use shared logger
+        self._session: Optional[requests.Session] = None # Created on first blocking fetch (see session)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive session for blocking fetches, so repeated requests reuse pooled TCP/TLS connections.
+        Created on first use, so sources that only fetch over aiohttp never hold an idle pool.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=config.HTTP_POOL_MAXSIZE,
+                max_retries=Retry(total=config.HTTP_MAX_RETRIES, backoff_factor=config.HTTP_RETRY_BACKOFF)
+            ))
+        return self._session
+
+    def close(self) -> None:
+        """Closes the pooled connections of the blocking session, if one was created."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     @abstractmethod
     def fetch_news(self, target_coins_keywords: Dict[str, List[str]], limit: Optional[int] = 10) -> List[Article]:
@@ -19,6 +60,102 @@ class BaseNewsSource(ABC):
         """
         pass
 
+    async def fetch_news_async(
+        self,
+        target_coins_keywords: Dict[str, List[str]],
+        limit: Optional[int] = 10,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Article]:
+        """
+        Async variant of fetch_news, so several sources can be awaited concurrently.
+        session: Optional aiohttp session shared by the caller across sources; sources with native
+        async HTTP use it (or open their own if None). The default ignores it and runs the
+        blocking fetch_news in a worker thread.
+        """
+        return await asyncio.to_thread(self.fetch_news, target_coins_keywords, limit)
+
+    @staticmethod
+    def _build_keyword_matcher(target_coins_keywords: Dict[str, List[str]]) -> Tuple[Optional[Pattern], Dict[str, Set[str]]]:
+        """
+        Compiles all coin keywords into one case-insensitive alternation, so each text is scanned
+        once by the regex engine instead of once per keyword.
+        Returns the pattern (None if there are no keywords) and a casefolded keyword -> coin tickers map.
+        """
+        keyword_to_coins: Dict[str, Set[str]] = {}
+        pattern_keywords: Set[str] = set()
+        for coin_ticker, keywords in target_coins_keywords.items():
+            for keyword in keywords:
+                if keyword:
+                    pattern_keywords.add(keyword.lower())
+                    # Casefolded keys, so hits IGNORECASE matched in another Unicode case form still resolve
+                    keyword_to_coins.setdefault(keyword.casefold(), set()).add(coin_ticker)
+        if not keyword_to_coins:
+            return None, keyword_to_coins
+        # Longest keywords first so overlapping alternatives prefer the longer match;
+        # lookarounds instead of \b so keywords starting/ending in symbols still match whole words only
+        alternation = "|".join(re.escape(k) for k in sorted(pattern_keywords, key=len, reverse=True))
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE), keyword_to_coins
+
+    @staticmethod
+    def _find_coins_with_pattern(keyword_pattern: Pattern, keyword_to_coins: Dict[str, Set[str]], text: str) -> Set[str]:
+        """Coin tickers whose keywords occur in `text`, using a matcher from _build_keyword_matcher."""
+        # One C-level scan for all tickers; each distinct hit is casefolded and looked up once
+        return {
+            coin_ticker
+            for keyword in {hit.casefold() for hit in keyword_pattern.findall(text)}
+            # .get: a case variant IGNORECASE matched that still folds to no known key is skipped, not an error
+            for coin_ticker in keyword_to_coins.get(keyword, ())
+        }
+
+    @staticmethod
+    def _find_coins_with_automaton(automaton: Any, text: str) -> Set[str]:
+        """Coin tickers whose keywords occur in `text` as whole words, in one Aho-Corasick pass."""
+        text_lower = text.lower()
+        last = len(text_lower) - 1
+        found: Set[str] = set()
+        for end, (length, coin_tickers) in automaton.iter(text_lower):
+            start = end - length + 1
+            # Same whole-word rule as the regex matcher's (?<!\w) / (?!\w) lookarounds
+            if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] == "_"):
+                continue
+            if end < last and (text_lower[end + 1].isalnum() or text_lower[end + 1] == "_"):
+                continue
+            found.update(coin_tickers)
+        return found
+
+    def _checked_link(self, link: Any, title: str) -> Optional[str]:
+        """
+        Ingest check for every source: Article is a plain dataclass that validates nothing, so links are
+        checked here. Returns the link as a string, or None (logged) if it isn't an http(s) URL.
+        """
+        link = str(link)
+        if not link.startswith(("http://", "https://")):
+            self.logger.error(f"Skipping article '{title}' with invalid link: {link}")
+            return None
+        return link
+
+    @staticmethod
+    def _target_index(target_coins_keywords: Dict[str, List[str]]) -> TargetIndex:
+        """The TargetIndex for a target set; built on first use and shared by all sources."""
+        return _prepare_targets(tuple((coin_ticker, tuple(keywords)) for coin_ticker, keywords in target_coins_keywords.items()))
+
+    @staticmethod
+    def _build_coin_finder(target_coins_keywords: Dict[str, List[str]]) -> Optional[Callable[[str], Set[str]]]:
+        """
+        Returns a function mapping a text to the coin tickers whose keywords it mentions (whole words,
+        case-insensitive), or None if there are no keywords. Uses an Aho-Corasick automaton when
+        pyahocorasick is installed (config.KEYWORD_AUTOMATON for config.TARGET_COINS), else a compiled regex.
+        """
+        if config.KEYWORD_AUTOMATON is not None and target_coins_keywords == config.TARGET_COINS:
+            return partial(BaseNewsSource._find_coins_with_automaton, config.KEYWORD_AUTOMATON)
+        automaton = build_keyword_automaton(target_coins_keywords)
+        if automaton is not None:
+            return partial(BaseNewsSource._find_coins_with_automaton, automaton)
+        keyword_pattern, keyword_to_coins = BaseNewsSource._build_keyword_matcher(target_coins_keywords)
+        if keyword_pattern is None:
+            return None
+        return partial(BaseNewsSource._find_coins_with_pattern, keyword_pattern, keyword_to_coins)
+
     def _filter_and_create_articles(
         self,
         raw_items: List[Dict],
@@ -26,12 +163,21 @@ class BaseNewsSource(ABC):
         title_key: str,
         link_key: str,
         date_key: str,
-        source_name_override: Optional[str] = None,
+        source_name_override: Optional[Union[str, Callable[[Dict], str]]] = None,
         content_key: Optional[str] = None,
-        date_parser_func: Optional[callable] = None
+        date_parser_func: Optional[callable] = None,
+        extra_text_keys: Tuple[str, ...] = ()
     ) -> List[Article]:
-        """Helper to process raw items into Article objects, filtering by keywords."""
+        """
+        Helper to process raw items into Article objects, filtering by keywords.
+        extra_text_keys: Further text fields (e.g. a body excerpt) scanned for keywords but not stored.
+        """
         processed_articles: List[Article] = []
+        find_coins = self._target_index(target_coins_keywords).find_coins
+        if find_coins is None:
+            return processed_articles
+        # Resolve the source name once; NewsAPI passes a per-item callable instead of a fixed name
+        fixed_source_name = None if callable(source_name_override) else str(source_name_override or self.source_name)
         for item in raw_items:
             title = item.get(title_key, "")
             link = item.get(link_key)
@@ -42,47 +188,47 @@ class BaseNewsSource(ABC):
                 self.logger.debug(f"Skipping item due to missing critical fields: {item}")
                 continue
 
+            # One matcher pass over all text fields; the matcher's cost grows with text length, not keyword count
+            item_content = " ".join([title, content_snippet or "", *(item.get(key) or "" for key in extra_text_keys)])
+            related_coins_found = find_coins(item_content)
+            if not related_coins_found:
+                continue
+
+            # Parse the date once, only for relevant items
             try:
-                published_at = date_parser_func(raw_date) if date_parser_func else datetime.fromisoformat(str(raw_date).replace('Z', '+00:00'))
+                published_at = date_parser_func(raw_date) if date_parser_func else parse_iso_datetime(str(raw_date))
+                # Ensure the datetime is offset-aware (default to UTC if no timezone is provided)
+                if published_at.tzinfo is None:
+                    published_at = published_at.replace(tzinfo=timezone.utc)
             except Exception as e:
                 self.logger.warning(f"Could not parse date '{raw_date}' for article '{title}': {e}. Using current time.")
-                published_at = datetime.now()
-
-
-            item_content_lower = (title + " " + (content_snippet if content_snippet else "")).lower()
-            related_coins_found: List[str] = []
-
-            for coin_ticker, keywords in target_coins_keywords.items():
-                if any(keyword.lower() in item_content_lower for keyword in keywords):
-                    related_coins_found.append(coin_ticker)
-
-            if related_coins_found:
-                try:
-                # Parse the raw date
-                    published_at = date_parser_func(raw_date) if date_parser_func else datetime.fromisoformat(str(raw_date).replace('Z', '+00:00'))
-                    
-                    # Ensure the datetime is offset-aware (default to UTC if no timezone is provided)
-                    if published_at.tzinfo is None:
-                        published_at = published_at.replace(tzinfo=timezone.utc)
-                except Exception as e:
-                    self.logger.warning(f"Could not parse date '{raw_date}' for article '{title}': {e}. Using current time.")
-                    published_at = datetime.now(timezone.utc)  # Use current time with UTC timezone
-                    
-                try:
-                    article = Article(
-                        title=title,
-                        link=link,
-                        published_at = date_parser_func(raw_date) if date_parser_func else datetime.fromisoformat(str(raw_date).replace('Z', '+00:00')),
-                        source_name=str(source_name_override) or str(self.source_name),
-                        content_snippet=content_snippet,
-                        related_coins=list(set(related_coins_found)) # Ensure uniqueness
-                    )
-                    processed_articles.append(article)
-                except Exception as e: # Catches Pydantic validation errors, etc.
-                    self.logger.error(f"Error creating Article object for '{title}': {e}")
-                    self.logger.error(f"  title: {title} (type: {type(title)})")
-                    self.logger.error(f"  link: {link} (type: {type(link)})")
-                    self.logger.error(f"  published_at: {published_at} (type: {type(published_at)})")
-                    self.logger.error(f"  source_name: {source_name_override or self.source_name} (type: {type(source_name_override or self.source_name)})")
-                    self.logger.error(f"  content_snippet: {content_snippet} (type: {type(content_snippet)})")
-        return processed_articles
\ No newline at end of file
+                published_at = datetime.now(timezone.utc)  # Use current time with UTC timezone
+
+            link = self._checked_link(link, title)
+            if link is None:
+                continue
+
+            source_name = fixed_source_name if fixed_source_name is not None else str(source_name_override(item))
+            processed_articles.append(Article(
+                title=title,
+                link=link,
+                published_at=published_at,
+                source_name=source_name,
+                content_snippet=content_snippet,
+                related_coins=tuple(related_coins_found)
+            ))
+        return processed_articles
+
+@lru_cache(maxsize=64) # Room for the full target set plus NewsAPI's per-coin targets
+def _prepare_targets(frozen_targets: FrozenTargets) -> TargetIndex:
+    """
+    Builds the TargetIndex for a frozen target set. The targets are effectively constant for a run,
+    so the joined tickers and the keyword matcher are derived once instead of on every fetch.
+    """
+    # Tickers are interned once here; every set and dict built below (and each match result) shares them
+    target_coins_keywords = {sys.intern(coin_ticker): list(keywords) for coin_ticker, keywords in frozen_targets}
+    return TargetIndex(
+        tickers_csv=",".join(target_coins_keywords),
+        upper_to_ticker={coin_ticker.upper(): coin_ticker for coin_ticker in target_coins_keywords},
+        find_coins=BaseNewsSource._build_coin_finder(target_coins_keywords)
+    )
@@ -1,9 +1,11 @@
 # crypto_news_aggregator/news_sources/cryptopanic_source.py
-from datetime import datetime
+import asyncio
+import aiohttp
 import requests
-from typing import List, Dict, Optional
-from .base_source import BaseNewsSource
+from typing import Any, Callable, List, Dict, Optional, Set
+from .base_source import BaseNewsSource, TargetIndex
 from ..utils.data_models import Article
+from ..utils.helpers import decode_json_bytes, parse_iso_datetime
 from .. import config # For API key and settings
 
 class CryptoPanicSource(BaseNewsSource):
@@ -17,34 +19,29 @@ class CryptoPanicSource(BaseNewsSource):
         else:
             self.api_key = config.CRYPTOPANIC_API_KEY
 
-    def _get_related_coins_from_item(self, item: Dict, target_coins_keywords: Dict[str, List[str]]) -> List[str]:
-        """Determines related coin tickers from a CryptoPanic item and our target list."""
-        found_tickers = []
+    def _get_related_coins_from_item(
+        self,
+        item: Dict,
+        target_by_upper: Dict[str, str],
+        find_coins: Optional[Callable[[str], Set[str]]]
+    ) -> List[str]:
+        """
+        Determines related coin tickers from a CryptoPanic item and our target list.
+        target_by_upper: Uppercased target ticker -> target ticker (see TargetIndex.upper_to_ticker).
+        find_coins: Keyword matcher for the title fallback (see TargetIndex.find_coins), or None.
+        """
         # CryptoPanic API provides 'currencies' with codes
-        api_item_currencies = [c.get("code") for c in item.get("currencies", []) if c.get("code")]
-        if not api_item_currencies: # Fallback to title if no currencies in API response
-            title_lower = item.get("title", "").lower()
-            for ticker, keywords in target_coins_keywords.items():
-                if any(keyword.lower() in title_lower for keyword in keywords):
-                    found_tickers.append(ticker)
-        else:
-            for ticker in target_coins_keywords.keys(): # Check our target tickers
-                if ticker.upper() in [c.upper() for c in api_item_currencies]:
-                    found_tickers.append(ticker)
-        return list(set(found_tickers)) # Unique list
-
-
-    def fetch_news(self, target_coins_keywords: Dict[str, List[str]], limit: Optional[int] = 10) -> List[Article]:
-        if not self.api_key:
+        codes = {c["code"].upper() for c in item.get("currencies") or () if c.get("code")}
+        if codes:
+            return [target_by_upper[code] for code in codes & target_by_upper.keys()]
+        # Fallback to title (and description, when the API includes it) if no currencies in API response
+        if find_coins is None:
             return []
+        return list(find_coins(" ".join([item.get("title") or "", item.get("description") or ""])))
 
-        self.logger.info("Fetching news from CryptoPanic")
-        articles: List[Article] = []
-
-        # CryptoPanic API uses currency tickers. Extract them from target_coins_keywords.
-        # We'll use the keys of target_coins_keywords as the primary tickers.
-        currency_tickers = ",".join(target_coins_keywords.keys())
 
+    def _request_params(self, currency_tickers: str, limit: Optional[int]) -> Dict[str, Any]:
+        """Query parameters for one CryptoPanic posts request."""
         params = {
             "auth_token": self.api_key,
             "public": "true", # Get publicly available posts
@@ -55,45 +52,102 @@ class CryptoPanicSource(BaseNewsSource):
             params["filter"] = config.CRYPTOPANIC_FILTER
         if config.CRYPTOPANIC_KIND:
             params["kind"] = config.CRYPTOPANIC_KIND
+        return params
+
+    def _articles_from_results(self, raw_items: List[Dict], target_index: TargetIndex) -> List[Article]:
+        """Filters the posts of a CryptoPanic response into Article objects."""
+        articles: List[Article] = []
+        target_by_upper = target_index.upper_to_ticker
+        find_coins = target_index.find_coins
+
+        for item in raw_items:
+            title = item.get("title")
+            link = item.get("url")
+            published_at_str = item.get("created_at") # E.g., "2024-03-15T10:00:00Z"
+            source_domain = item.get("source", {}).get("domain", "CryptoPanic")
+
+            if not title or not link or not published_at_str:
+                self.logger.debug(f"Skipping CryptoPanic item due to missing fields: {title}")
+                continue
+
+            related_coins = self._get_related_coins_from_item(item, target_by_upper, find_coins)
+            if not related_coins: # Skip if not relevant to any of our target coins
+                self.logger.debug(f"Skipping CryptoPanic item as not related to target coins: {title}")
+                continue
+
+            link = self._checked_link(link, title)
+            if link is None:
+                continue
+
+            # Article does no validation of its own; the link is checked above and the date here
+            try:
+                published_at = parse_iso_datetime(published_at_str) # ciso8601 when installed; handles the 'Z' suffix
+            except (TypeError, ValueError) as e:
+                self.logger.error(f"Error parsing date of CryptoPanic item '{title}': {e}")
+                continue
+
+            articles.append(Article(
+                title=title,
+                link=link,
+                published_at=published_at,
+                source_name=source_domain,
+                content_snippet=title, # CryptoPanic titles are often descriptive enough
+                related_coins=tuple(related_coins)
+            ))
+        return articles
+
+    def fetch_news(self, target_coins_keywords: Dict[str, List[str]], limit: Optional[int] = 10) -> List[Article]:
+        if not self.api_key:
+            return []
+
+        self.logger.info("Fetching news from CryptoPanic")
+        articles: List[Article] = []
+
+        # CryptoPanic API uses currency tickers. Extract them from target_coins_keywords.
+        # We'll use the keys of target_coins_keywords as the primary tickers.
+        target_index = self._target_index(target_coins_keywords)
+        currency_tickers = target_index.tickers_csv
 
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=config.REQUEST_TIMEOUT)
+            response = self.session.get(self.BASE_URL, params=self._request_params(currency_tickers, limit), timeout=config.REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-            raw_items = data.get("results", [])
-
-            for item in raw_items:
-                title = item.get("title")
-                link = item.get("url")
-                published_at_str = item.get("created_at") # E.g., "2024-03-15T10:00:00Z"
-                source_domain = item.get("source", {}).get("domain", "CryptoPanic")
-
-                if not title or not link or not published_at_str:
-                    self.logger.debug(f"Skipping CryptoPanic item due to missing fields: {title}")
-                    continue
-
-                related_coins = self._get_related_coins_from_item(item, target_coins_keywords)
-                if not related_coins: # Skip if not relevant to any of our target coins
-                    self.logger.debug(f"Skipping CryptoPanic item as not related to target coins: {title}")
-                    continue
-
-                try:
-                    article = Article(
-                        title=title,
-                        link=link,
-                        published_at=datetime.fromisoformat(published_at_str.replace('Z', '+00:00')),
-                        source_name=source_domain,
-                        content_snippet=title, # CryptoPanic titles are often descriptive enough
-                        related_coins=related_coins
-                    )
-                    articles.append(article)
-                except Exception as e:
-                    self.logger.error(f"Error creating Article from CryptoPanic item '{title}': {e}")
-
+            data = decode_json_bytes(response.content)
+            articles = self._articles_from_results(data.get("results", []), target_index)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching from CryptoPanic for tickers '{currency_tickers}': {e}")
         except Exception as e:
             self.logger.error(f"An unexpected error occurred with CryptoPanic: {e}")
 
         self.logger.info(f"Found {len(articles)} relevant articles from CryptoPanic")
-        return articles
\ No newline at end of file
+        return articles
+
+    async def fetch_news_async(
+        self,
+        target_coins_keywords: Dict[str, List[str]],
+        limit: Optional[int] = 10,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Article]:
+        """Native aiohttp variant of fetch_news, so it can share the caller's session with other sources."""
+        if not self.api_key:
+            return []
+        if session is None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)) as own_session:
+                return await self.fetch_news_async(target_coins_keywords, limit, own_session)
+
+        self.logger.info("Fetching news from CryptoPanic")
+        articles: List[Article] = []
+        target_index = self._target_index(target_coins_keywords)
+        currency_tickers = target_index.tickers_csv
+
+        try:
+            async with session.get(self.BASE_URL, params=self._request_params(currency_tickers, limit)) as response:
+                response.raise_for_status()
+                data = decode_json_bytes(await response.read())
+            articles = self._articles_from_results(data.get("results", []), target_index)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Error fetching from CryptoPanic for tickers '{currency_tickers}': {e}")
+        except Exception as e:
+            self.logger.error(f"An unexpected error occurred with CryptoPanic: {e}")
+
+        self.logger.info(f"Found {len(articles)} relevant articles from CryptoPanic")
+        return articles
@@ -1,9 +1,11 @@
 # crypto_news_aggregator/news_sources/newsapi_source.py
-import requests
+import asyncio
+import aiohttp
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from .base_source import BaseNewsSource
 from ..utils.data_models import Article
+from ..utils.helpers import decode_json_bytes
 from .. import config # For API key and settings
 
 class NewsApiSource(BaseNewsSource):
@@ -18,54 +20,77 @@ class NewsApiSource(BaseNewsSource):
             self.api_key = config.NEWSAPI_KEY
 
     def fetch_news(self, target_coins_keywords: Dict[str, List[str]], limit: Optional[int] = 10) -> List[Article]:
+        """Blocking wrapper around fetch_news_async; must not be called from a running event loop."""
+        return asyncio.run(self.fetch_news_async(target_coins_keywords, limit))
+
+    async def fetch_news_async(
+        self,
+        target_coins_keywords: Dict[str, List[str]],
+        limit: Optional[int] = 10,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Article]:
+        """Queries NewsAPI for every target coin concurrently (one request per coin)."""
         if not self.api_key:
             return []
 
-        all_articles: List[Article] = []
         self.logger.info(f"Fetching news from NewsAPI.org")
+        if session is None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)) as own_session:
+                return await self.fetch_news_async(target_coins_keywords, limit, own_session)
 
-        for coin_ticker, keywords in target_coins_keywords.items():
-            self.logger.debug(f"Querying NewsAPI for {coin_ticker} (Keywords: {keywords})")
-            query = " OR ".join(f'"{k}"' for k in keywords) # Exact phrase matching
-            from_date = (datetime.now() - timedelta(days=config.NEWSAPI_DAYS_AGO)).strftime('%Y-%m-%dT%H:%M:%S')
+        from_date = (datetime.now() - timedelta(days=config.NEWSAPI_DAYS_AGO)).strftime('%Y-%m-%dT%H:%M:%S')
+        coins = list(target_coins_keywords.items())
+        results = await asyncio.gather(
+            *(self._fetch_coin_news(session, coin_ticker, keywords, from_date) for coin_ticker, keywords in coins),
+            return_exceptions=True
+        )
 
-            params = {
-                "q": query,
-                "from": from_date,
-                "sortBy": config.NEWSAPI_SORT_BY,
-                "language": config.NEWSAPI_LANGUAGE,
-                "apiKey": self.api_key,
-                "pageSize": 50 # Request a decent number, NewsAPI might limit this
-            }
-            try:
-                response = requests.get(self.BASE_URL, params=params, timeout=config.REQUEST_TIMEOUT)
-                response.raise_for_status()
-                data = response.json()
-
-                raw_articles = data.get("articles", [])
-                # For NewsAPI, the keywords used in the query are directly relevant to the coin
-                # So we can assume articles returned are for this specific coin_ticker's keywords.
-                # We'll use a simplified _filter_and_create_articles call by creating a temp target.
-                temp_target_for_coin = {coin_ticker: keywords}
+        all_articles: List[Article] = []
+        for (coin_ticker, keywords), result in zip(coins, results):
+            if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+                self.logger.error(f"Error fetching from NewsAPI for {coin_ticker} (Keywords: {keywords}): {result}")
+            elif isinstance(result, Exception):
+                self.logger.error(f"An unexpected error occurred with NewsAPI for {coin_ticker} (Keywords: {keywords}): {result}")
+            else:
+                all_articles.extend(result)
+                self.logger.info(f"  Found {len(result)} articles for {coin_ticker} via NewsAPI")
+        return all_articles
 
-                articles_for_coin = self._filter_and_create_articles(
-                    raw_items=raw_articles,
-                    target_coins_keywords=temp_target_for_coin, # Filter specifically for this coin's keywords
-                    title_key="title",
-                    link_key="url",
-                    date_key="publishedAt",
-                    content_key="description", # NewsAPI provides 'description'
-                    source_name_override=lambda item: item.get("source", {}).get("name", "NewsAPI") # Dynamic source name
-                )
-                # Assign the specific coin ticker to these articles
-                for article in articles_for_coin:
-                    article.related_coins = [coin_ticker]
+    async def _fetch_coin_news(
+        self,
+        session: aiohttp.ClientSession,
+        coin_ticker: str,
+        keywords: List[str],
+        from_date: str
+    ) -> List[Article]:
+        """Fetches and filters the NewsAPI results for one coin's keywords."""
+        self.logger.debug(f"Querying NewsAPI for {coin_ticker} (Keywords: {keywords})")
+        query = " OR ".join(f'"{k}"' for k in keywords) # Exact phrase matching
+        params = {
+            "q": query,
+            "from": from_date,
+            "sortBy": config.NEWSAPI_SORT_BY,
+            "language": config.NEWSAPI_LANGUAGE,
+            "apiKey": self.api_key,
+            "pageSize": 50 # Request a decent number, NewsAPI might limit this
+        }
+        async with session.get(self.BASE_URL, params=params) as response:
+            response.raise_for_status()
+            data = decode_json_bytes(await response.read())
 
-                all_articles.extend(articles_for_coin)
-                self.logger.info(f"  Found {len(articles_for_coin)} articles for {coin_ticker} via NewsAPI")
+        raw_articles = data.get("articles", [])
+        # For NewsAPI, the keywords used in the query are directly relevant to the coin
+        # So we can assume articles returned are for this specific coin_ticker's keywords.
+        # Filtering against a temp target with only this coin also makes related_coins == (coin_ticker,).
+        temp_target_for_coin = {coin_ticker: keywords}
 
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error fetching from NewsAPI for '{query}': {e}")
-            except Exception as e:
-                self.logger.error(f"An unexpected error occurred with NewsAPI for '{query}': {e}")
-        return all_articles
\ No newline at end of file
+        return self._filter_and_create_articles(
+            raw_items=raw_articles,
+            target_coins_keywords=temp_target_for_coin, # Filter specifically for this coin's keywords
+            title_key="title",
+            link_key="url",
+            date_key="publishedAt",
+            content_key="description", # NewsAPI provides 'description'
+            extra_text_keys=("content",), # Truncated article body, also scanned for keywords
+            source_name_override=lambda item: item.get("source", {}).get("name", "NewsAPI") # Dynamic source name
+        )
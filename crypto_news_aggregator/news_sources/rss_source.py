@@ -1,55 +1,169 @@
 # crypto_news_aggregator/news_sources/rss_source.py
+import asyncio
+import aiohttp
 import feedparser
+import requests
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from .base_source import BaseNewsSource
 from ..utils.data_models import Article
+from .. import config
+
+try:
+    import diskcache # Optional: persists feed validators and entries across runs
+except ImportError:
+    diskcache = None
+
+# Last download of each feed by URL: {"etag", "modified", "raw_items"}. Shared by all RSSSource
+# instances (the aggregator creates new ones per run), and mirrored to disk when diskcache is installed.
+_FEED_CACHE: Dict[str, Dict[str, Any]] = {}
+_FEED_DISK_CACHE = diskcache.Cache(config.RSS_CACHE_DIR) if diskcache is not None and config.RSS_CACHE_DIR else None
+
 class RSSSource(BaseNewsSource):
+    USER_AGENT = 'MyCryptoNewsAggregator/1.0'
+
     def __init__(self, source_name: str, feed_url: str):
         super().__init__(source_name)
         self.feed_url = feed_url
 
+    def _cached_feed(self) -> Optional[Dict[str, Any]]:
+        """The last download of this feed (memory first, then disk), or None."""
+        cached = _FEED_CACHE.get(self.feed_url)
+        if cached is None and _FEED_DISK_CACHE is not None:
+            cached = _FEED_DISK_CACHE.get(("rss", self.feed_url))
+            if cached is not None:
+                _FEED_CACHE[self.feed_url] = cached
+        return cached
+
+    def _request_headers(self, cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Request headers, made conditional on the cached validators so an unchanged feed returns 304."""
+        headers = {'User-Agent': self.USER_AGENT}
+        if cached is not None:
+            if cached.get("etag"):
+                headers['If-None-Match'] = cached["etag"]
+            if cached.get("modified"):
+                headers['If-Modified-Since'] = cached["modified"]
+        return headers
+
+    def _remember_feed(self, raw_items: List[Dict[str, Any]], response_headers: Any) -> None:
+        """Caches a freshly downloaded feed with its validators; feeds without validators are not cached."""
+        etag, modified = response_headers.get('ETag'), response_headers.get('Last-Modified')
+        if not etag and not modified:
+            return
+        cached = {"etag": etag, "modified": modified, "raw_items": raw_items}
+        _FEED_CACHE[self.feed_url] = cached
+        if _FEED_DISK_CACHE is not None:
+            _FEED_DISK_CACHE.set(("rss", self.feed_url), cached)
+
     def _parse_rss_date(self, entry: Any) -> datetime:
-        """Attempts to parse date from various RSS entry formats."""
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            return datetime(*entry.published_parsed[:6])
-        if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            return datetime(*entry.updated_parsed[:6])
-        # Add more fallbacks if necessary, e.g., parsing from entry.published string
+        """Attempts to parse date from various RSS entry formats. Naive dates are taken as UTC."""
+        # RFC 822 date string first (the RSS norm), parsed directly by the stdlib
+        date_string = entry.get('published') or entry.get('updated')
+        if date_string:
+            try:
+                published_at = parsedate_to_datetime(date_string)
+                return published_at if published_at.tzinfo else published_at.replace(tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                pass # E.g. ISO-8601 dates in Atom feeds; use feedparser's parsed struct_time below
+        # feedparser normalizes its parsed struct_time to UTC
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if parsed:
+            return datetime(*parsed[:6], tzinfo=timezone.utc)
         self.logger.warning(f"No standard parsed date for entry in {self.source_name}. Using current time.")
-        return datetime.now()
+        return datetime.now(timezone.utc)
+
+    def _raw_items_from_feed(self, body: bytes) -> List[Dict[str, Any]]:
+        """Parses a feed body into plain (picklable) item dicts for _articles_from_items and the feed cache."""
+        feed = feedparser.parse(body)
+        if feed.bozo: # Indicates an error during parsing
+            self.logger.warning(f"Error parsing RSS feed {self.feed_url}: {feed.bozo_exception}")
+            # return articles # Optionally return empty or try to process what was parsed
+
+        raw_items = []
+        for entry in feed.entries:
+            raw_items.append({
+                "title": entry.title,
+                "link": entry.link,
+                # Only the date fields _parse_rss_date reads, so cached items stay small
+                "published_date_obj": {
+                    key: entry.get(key) for key in ('published', 'updated', 'published_parsed', 'updated_parsed')
+                },
+                "summary": entry.get("summary", entry.title) # Use title if summary is missing
+            })
+        return raw_items
 
+    def _articles_from_body(self, body: bytes, response_headers: Any, target_coins_keywords: Dict[str, List[str]]) -> List[Article]:
+        """Parses and caches a freshly downloaded feed, then filters it into Article objects."""
+        raw_items = self._raw_items_from_feed(body)
+        self._remember_feed(raw_items, response_headers)
+        return self._articles_from_items(raw_items, target_coins_keywords)
+
+    def _articles_from_items(self, raw_items: List[Dict[str, Any]], target_coins_keywords: Dict[str, List[str]]) -> List[Article]:
+        """Filters parsed feed items into Article objects."""
+        return self._filter_and_create_articles(
+            raw_items=raw_items,
+            target_coins_keywords=target_coins_keywords,
+            title_key="title",
+            link_key="link",
+            date_key="published_date_obj", # Key for the object to pass to date_parser_func
+            content_key="summary",
+            date_parser_func=self._parse_rss_date,
+            source_name_override=self.source_name # Use the specific RSS source name
+        )
 
     def fetch_news(self, target_coins_keywords: Dict[str, List[str]], limit: Optional[int] = 10) -> List[Article]:
         self.logger.info(f"Fetching news from RSS feed: {self.source_name} ({self.feed_url})")
         articles: List[Article] = []
         try:
-            feed = feedparser.parse(self.feed_url, request_headers={'User-Agent': 'MyCryptoNewsAggregator/1.0'})
-            if feed.bozo: # Indicates an error during parsing
-                self.logger.warning(f"Error parsing RSS feed {self.feed_url}: {feed.bozo_exception}")
-                # return articles # Optionally return empty or try to process what was parsed
-
-            raw_items = []
-            for entry in feed.entries:
-                raw_items.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "published_date_obj": entry, # Pass the whole entry for flexible date parsing
-                    "summary": entry.get("summary", entry.title) # Use title if summary is missing
-                })
-
-            articles = self._filter_and_create_articles(
-                raw_items=raw_items,
-                target_coins_keywords=target_coins_keywords,
-                title_key="title",
-                link_key="link",
-                date_key="published_date_obj", # Key for the object to pass to date_parser_func
-                content_key="summary",
-                date_parser_func=self._parse_rss_date,
-                source_name_override=self.source_name # Use the specific RSS source name
-            )
+            cached = self._cached_feed()
+            response = self.session.get(self.feed_url, headers=self._request_headers(cached), timeout=config.REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached is not None:
+                self.logger.debug("RSS feed %s not modified; using cached entries", self.feed_url)
+                articles = self._articles_from_items(cached["raw_items"], target_coins_keywords)
+            else:
+                response.raise_for_status()
+                articles = self._articles_from_body(response.content, response.headers, target_coins_keywords)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error fetching RSS feed {self.feed_url}: {e}")
+        except Exception as e:
+            self.logger.error(f"An unexpected error occurred fetching RSS feed {self.feed_url}: {e}")
+        self.logger.info(f"Found {len(articles)} relevant articles from {self.source_name}")
+        return articles
 
+    async def fetch_news_async(
+        self,
+        target_coins_keywords: Dict[str, List[str]],
+        limit: Optional[int] = 10,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Article]:
+        """
+        Downloads the feed with aiohttp (conditionally, so an unchanged feed is served from the cache);
+        the CPU-bound XML parse and filtering run in a worker thread.
+        """
+        if session is None:
+            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)) as own_session:
+                return await self.fetch_news_async(target_coins_keywords, limit, own_session)
+
+        self.logger.info(f"Fetching news from RSS feed: {self.source_name} ({self.feed_url})")
+        articles: List[Article] = []
+        try:
+            cached = self._cached_feed()
+            async with session.get(self.feed_url, headers=self._request_headers(cached)) as response:
+                if response.status == 304 and cached is not None:
+                    body = None
+                else:
+                    response.raise_for_status()
+                    body = await response.read()
+            # One worker-thread hop for the XML parse and keyword filtering, keeping the event loop free
+            if body is None:
+                self.logger.debug("RSS feed %s not modified; using cached entries", self.feed_url)
+                articles = await asyncio.to_thread(self._articles_from_items, cached["raw_items"], target_coins_keywords)
+            else:
+                articles = await asyncio.to_thread(self._articles_from_body, body, response.headers, target_coins_keywords)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Error fetching RSS feed {self.feed_url}: {e}")
         except Exception as e:
             self.logger.error(f"An unexpected error occurred fetching RSS feed {self.feed_url}: {e}")
         self.logger.info(f"Found {len(articles)} relevant articles from {self.source_name}")
-        return articles
\ No newline at end of file
+        return articles
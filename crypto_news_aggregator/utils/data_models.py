@@ -1,29 +1,33 @@
 # crypto_news_aggregator/utils/data_models.py
-from pydantic import BaseModel, HttpUrl, Field
-from typing import List, Optional
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
-class Article(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Article:
+    """
+    A news article. Plain slotted dataclass rather than a pydantic model: articles are built in bulk
+    from already-parsed feed data, and sources check fields at ingest.
+    Equality and hashing use (title, link) only, for deduplication.
+    """
     title: str
-    link: HttpUrl
-    published_at: datetime
-    source_name: str
-    content_snippet: Optional[str] = None # Summary or short description
-    related_coins: List[str] = Field(default_factory=list) # List of tickers like ["BTC", "ETH"]
+    link: str
+    published_at: datetime = field(compare=False) # Timezone-aware; sources default to UTC
+    source_name: str = field(compare=False)
+    content_snippet: Optional[str] = field(default=None, compare=False) # Summary or short description
+    related_coins: Tuple[str, ...] = field(default=(), compare=False) # Tickers like ("BTC", "ETH")
 
-    class Config:
-        # Allow arbitrary types for datetime, as feedparser might return non-standard datetime objects
-        # We handle conversion in the source modules
-        arbitrary_types_allowed = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict; published_at is rendered as an ISO-8601 string."""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "published_at": self.published_at.isoformat(),
+            "source_name": self.source_name,
+            "content_snippet": self.content_snippet,
+            "related_coins": list(self.related_coins),
         }
 
-    def __hash__(self):
-        # For use in sets for deduplication
-        return hash((self.title, self.link))
-
-    def __eq__(self, other):
-        if not isinstance(other, Article):
-            return NotImplemented
-        return (self.title, self.link) == (other.title, other.link)
\ No newline at end of file
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
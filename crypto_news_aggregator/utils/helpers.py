@@ -1,9 +1,31 @@
 # crypto_news_aggregator/utils/helpers.py
-from datetime import timezone
+from datetime import datetime, timezone
+import json
 import logging
-from typing import List, Set
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 from .data_models import Article
 
+try:
+    import ciso8601 # Optional C parser for ISO-8601 timestamps
+except ImportError:
+    ciso8601 = None
+
+try:
+    import ahocorasick # Optional (pyahocorasick): single-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import msgspec # Optional fast JSON decoder for API responses
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson # Optional fast JSON decoder, used when msgspec is missing
+except ImportError:
+    orjson = None
+
 def setup_logging(level=logging.INFO):
     logging.basicConfig(
         level=level,
@@ -14,20 +36,55 @@ def setup_logging(level=logging.INFO):
 
 logger = setup_logging()
 
+def parse_iso_datetime(value: str) -> datetime:
+    """Parses an ISO-8601 timestamp (including a 'Z' suffix), using ciso8601 when it is installed."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def build_keyword_automaton(target_coins_keywords: Dict[str, List[str]]) -> Optional[Any]:
+    """
+    Builds an Aho-Corasick automaton over the lowercased keywords of `target_coins_keywords`.
+    Each keyword maps to (keyword length, frozenset of coin tickers). None if pyahocorasick is missing.
+    """
+    if ahocorasick is None:
+        return None
+    keyword_to_coins = {}
+    for coin_ticker, keywords in target_coins_keywords.items():
+        for keyword in keywords:
+            if keyword:
+                keyword_to_coins.setdefault(keyword.lower(), set()).add(coin_ticker)
+    if not keyword_to_coins:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, coin_tickers in keyword_to_coins.items():
+        automaton.add_word(keyword, (len(keyword), frozenset(coin_tickers)))
+    automaton.make_automaton()
+    return automaton
+
+def decode_json_bytes(content: bytes) -> Any:
+    """Decodes a raw JSON body, with msgspec or orjson when installed, else the stdlib json module."""
+    if msgspec is not None:
+        return msgspec.json.decode(content)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 def deduplicate_articles(articles: List[Article]) -> List[Article]:
-    """Deduplicates a list of Article objects based on title and link."""
-    seen_articles: Set[Article] = set()
-    unique_articles: List[Article] = []
+    """Deduplicates a list of Article objects based on title and link, keeping the first seen."""
+    unique_by_key: Dict[Tuple[str, str], Article] = {}
     for article in articles:
-        if article not in seen_articles:
-            unique_articles.append(article)
-            seen_articles.add(article)
+        unique_by_key.setdefault((article.title, article.link), article)
+    unique_articles = list(unique_by_key.values())
     logger.info(f"Deduplicated articles: {len(articles)} -> {len(unique_articles)}")
     return unique_articles
 
 def sort_articles_by_date(articles: List[Article], reverse: bool = True) -> List[Article]:
-    """Sorts articles by published_at date."""
-    for article in articles:
-        if article.published_at.tzinfo is None:
-            article.published_at = article.published_at.replace(tzinfo=timezone.utc)
-    return sorted(articles, key=lambda x: x.published_at, reverse=reverse)
\ No newline at end of file
+    """Sorts articles by published_at date. Naive datetimes are compared as UTC; articles are not modified."""
+    # Decorate-sort-undecorate: normalize each date once in a comprehension, then sort on the cached key
+    decorated = [
+        (article.published_at if article.published_at.tzinfo else article.published_at.replace(tzinfo=timezone.utc), article)
+        for article in articles
+    ]
+    decorated.sort(key=itemgetter(0), reverse=reverse)
+    return [article for _, article in decorated]
\ No newline at end of file
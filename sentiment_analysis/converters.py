@@ -1,4 +1,8 @@
+import numpy as np
+
 # --- Convert Sentiment to Trading Signal ---
+_SIGNAL_BY_SENTIMENT = {"Positive": 1, "Negative": -1} # Buy / Sell; anything else is Hold
+
 def sentiment_to_trading_signal(sentiment):
     """
     Converts sentiment string to a numerical trading signal.
@@ -6,9 +10,15 @@ def sentiment_to_trading_signal(sentiment):
     -1 for Sell (Negative)
      0 for Hold (Neutral/Uncertain)
     """
-    if sentiment == "Positive":
-        return 1  # Buy signal
-    elif sentiment == "Negative":
-        return -1 # Sell signal
-    else: # Neutral or Uncertain
-        return 0  # Hold signal
\ No newline at end of file
+    return _SIGNAL_BY_SENTIMENT.get(sentiment, 0) # Neutral or Uncertain: Hold
+
+def sentiments_to_signals(sentiments):
+    """
+    Vectorized sentiment_to_trading_signal for a batch of sentiment strings (array or sequence).
+    Returns an int8 array of +1 (Positive), -1 (Negative) and 0 (anything else).
+    """
+    sentiments = np.asarray(sentiments)
+    signals = np.zeros(sentiments.shape, dtype=np.int8)
+    signals[sentiments == "Positive"] = 1
+    signals[sentiments == "Negative"] = -1
+    return signals
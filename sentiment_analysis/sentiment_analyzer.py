@@ -1,3 +1,7 @@
+import asyncio
+import os
+import re
+from collections import OrderedDict
 from api_client.OllamaClient import OllamaClient
 try:
     from openai import OpenAI
@@ -6,15 +10,33 @@ except ImportError:
     print("Install with: pip install openai")
     OpenAI = None # type: ignore
 
+try:
+    import diskcache # Optional: persists the sentiment cache across runs
+except ImportError:
+    diskcache = None
+
+SENTIMENT_CACHE_SIZE = 8192 # Max (headline, coin) results kept in memory
+SENTIMENT_DISK_CACHE_DIR = os.path.expanduser("~/.cache/ctb/sentiment")
+CACHEABLE_SENTIMENTS = ("Positive", "Negative", "Neutral") # Failures and unparsable replies are retried
+SENTIMENT_BATCH_SIZE = 16 # Headlines classified per LLM request in analyze_sentiments_batch
+_SENTIMENT_LABELS = {label: label for label in CACHEABLE_SENTIMENTS} # Exact-reply lookup in _classify
+
+# One "<index>: <label>" line per headline in a batch reply
+_BATCH_LINE_PATTERN = re.compile(r"^\W*(\d+)\s*[:.)\-]\s*\W*(positive|negative|neutral)\b", re.IGNORECASE | re.MULTILINE)
+
 
 class SentimentAnalyzer:
     """
     A class to analyze sentiment of text using LLMs.
     """
 
-    def __init__(self, llm_method="openai", api_client=None):
+    def __init__(self, llm_method="openai", api_client=None, cache_size=SENTIMENT_CACHE_SIZE, disk_cache_dir=SENTIMENT_DISK_CACHE_DIR):
         self.llm_method = llm_method
         self.api_client = api_client or OllamaClient()
+        # LRU of classified headlines: syndicated news repeats the same text, and each LLM call is slow
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._disk_cache = diskcache.Cache(disk_cache_dir) if diskcache is not None and disk_cache_dir else None
 
 
     def analyze_sentiment(self, text_to_analyze, target_coin):
@@ -23,11 +45,150 @@ class SentimentAnalyzer:
         """
         return self.get_sentiment_signal(text_to_analyze, target_coin, self.llm_method)
     
+    def _cache_key(self, text_to_analyze, target_coin, llm_method):
+        """Normalized cache key; the model is included so switching models doesn't serve stale labels."""
+        return (text_to_analyze.strip().lower(), target_coin, llm_method, getattr(self.api_client, "model", None))
+
     def get_sentiment_signal(self, text_to_analyze, target_coin, llm_method="openai"):
         """
-        Gets a sentiment signal from the LLM for the given text.
+        Gets a sentiment signal from the LLM for the given text, from the cache when it was seen before.
         Returns a sentiment string like "Positive", "Negative", "Neutral", or None.
         """
+        key = self._cache_key(text_to_analyze, target_coin, llm_method)
+        sentiment = self._cached_sentiment(key)
+        if sentiment is None:
+            sentiment = self._classify(text_to_analyze, target_coin, llm_method)
+            self._remember(key, sentiment)
+        return sentiment
+
+    def _cached_sentiment(self, key):
+        """Returns the cached label for a key (memory first, then disk), or None."""
+        sentiment = self._cache.get(key)
+        if sentiment is None and self._disk_cache is not None:
+            sentiment = self._disk_cache.get(key)
+            if sentiment is not None:
+                self._remember(key, sentiment, persist=False)
+        elif sentiment is not None:
+            self._cache.move_to_end(key)
+        return sentiment
+
+    def _remember(self, key, sentiment, persist=True):
+        """Caches a definite label, evicting the least recently used entry when full."""
+        if sentiment not in CACHEABLE_SENTIMENTS:
+            return
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, sentiment)
+        self._cache[key] = sentiment
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _pending_batches(self, items, llm_method, batch_size):
+        """
+        Resolves cached items and groups the rest (deduplicated) into batches.
+        Returns (results, batches): results has the cached labels (None elsewhere); each batch is a
+        list of (key, text, coin) tuples.
+        """
+        results = [None] * len(items)
+        pending = {} # key -> (text, coin), in first-seen order
+        for i, (text_to_analyze, target_coin) in enumerate(items):
+            key = self._cache_key(text_to_analyze, target_coin, llm_method)
+            results[i] = self._cached_sentiment(key)
+            if results[i] is None:
+                pending.setdefault(key, (text_to_analyze, target_coin))
+        pending_items = [(key, text, coin) for key, (text, coin) in pending.items()]
+        batches = [pending_items[i:i + batch_size] for i in range(0, len(pending_items), batch_size)]
+        return results, batches
+
+    def _fill_results(self, items, llm_method, results, labels_by_key):
+        """Stores fresh labels in the cache and in the still-empty result slots."""
+        for key, sentiment in labels_by_key.items():
+            self._remember(key, sentiment)
+        for i, (text_to_analyze, target_coin) in enumerate(items):
+            if results[i] is None:
+                results[i] = labels_by_key.get(self._cache_key(text_to_analyze, target_coin, llm_method))
+        return results
+
+    def analyze_sentiments_batch(self, items, batch_size=SENTIMENT_BATCH_SIZE):
+        """
+        Classifies many (text, target_coin) pairs with one LLM request per batch of `batch_size`
+        instead of one request per headline. Cached pairs are not sent again.
+        Returns the sentiment labels (or None) in the same order as `items`.
+        """
+        results, batches = self._pending_batches(items, self.llm_method, batch_size)
+        labels_by_key = {}
+        for batch in batches:
+            labels_by_key.update(self._classify_batch(batch, self.llm_method))
+        return self._fill_results(items, self.llm_method, results, labels_by_key)
+
+    async def analyze_sentiments_batch_async(self, items, batch_size=SENTIMENT_BATCH_SIZE):
+        """
+        Async analyze_sentiments_batch: the batch requests run concurrently. The API client is
+        blocking, so each batch request runs in a worker thread.
+        """
+        results, batches = self._pending_batches(items, self.llm_method, batch_size)
+        batch_labels = await asyncio.gather(*(
+            asyncio.to_thread(self._classify_batch, batch, self.llm_method) for batch in batches
+        ))
+        labels_by_key = {}
+        for labels in batch_labels:
+            labels_by_key.update(labels)
+        return self._fill_results(items, self.llm_method, results, labels_by_key)
+
+    def _classify_batch(self, batch, llm_method):
+        """
+        Classifies a batch of (key, text, coin) tuples in one LLM request and returns key -> label.
+        Items missing from a reply are classified one by one; if the request fails, every label is None.
+        """
+        if len(batch) == 1:
+            key, text_to_analyze, target_coin = batch[0]
+            return {key: self._classify(text_to_analyze, target_coin, llm_method)}
+
+        system_prompt = (
+            "You are a financial sentiment analyst. "
+            "Analyze the sentiment of each of the following numbered crypto news headlines based on its given crypto. "
+            "Classify each sentiment strictly as 'Positive', 'Negative', or 'Neutral'. "
+            f"Reply with exactly {len(batch)} lines in the form '<number>: <classification>' and nothing else."
+        )
+        user_prompt_content = "\n".join(
+            f"{i}. Target Coin: {target_coin} | News Headline: \"{text_to_analyze}\""
+            for i, (_, text_to_analyze, target_coin) in enumerate(batch, start=1)
+        )
+        max_tokens = 10 * len(batch) + 20 # Room for one short line per headline
+
+        llm_response = None
+        if llm_method == "openai" and OpenAI is not None:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt_content}
+            ]
+            llm_response = self.api_client.query_ollama_openai_compatible(messages, max_tokens=max_tokens)
+        elif llm_method == "direct":
+            full_prompt = f"{system_prompt}\n\nUser: {user_prompt_content}\nAssistant (Numbered Classifications Only):"
+            llm_response = self.api_client.query_ollama_direct(full_prompt, max_tokens=max_tokens)
+        else:
+            print(f"Unknown LLM method: {llm_method} or OpenAI library missing.")
+            return {key: None for key, _, _ in batch}
+
+        if not llm_response:
+            # The request itself failed (LLM down or timed out): retrying each item would only multiply the wait
+            return {key: None for key, _, _ in batch}
+
+        labels = {}
+        for index, label in _BATCH_LINE_PATTERN.findall(llm_response):
+            position = int(index) - 1
+            if 0 <= position < len(batch):
+                labels.setdefault(batch[position][0], label.capitalize())
+        for key, text_to_analyze, target_coin in batch:
+            if key not in labels:
+                labels[key] = self._classify(text_to_analyze, target_coin, llm_method)
+        return labels
+
+    def _classify(self, text_to_analyze, target_coin, llm_method):
+        """
+        Queries the LLM for the sentiment of the given text (uncached).
+        Returns a sentiment string like "Positive", "Negative", "Neutral", "Uncertain", or None.
+        """
         # You might want to add more context or few-shot examples for better results
         system_prompt = (
             "You are a financial sentiment analyst. "
@@ -56,7 +217,11 @@ class SentimentAnalyzer:
 
         if llm_response:
             print(f"  LLM Raw Response: '{llm_response}'")
-            # Basic parsing (can be improved with regex or more robust checks)
+            # Well-behaved replies are just the label (maybe with a trailing period): one dict lookup
+            sentiment = _SENTIMENT_LABELS.get(llm_response.strip().strip('.').title())
+            if sentiment is not None:
+                return sentiment
+            # Otherwise look for a label anywhere in the reply
             response_lower = llm_response.lower()
             if "positive" in response_lower:
                 return "Positive"
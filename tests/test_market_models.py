@@ -0,0 +1,35 @@
+# tests/test_market_models.py
+import unittest
+
+from crypto_market_exchange_manager.market_data_models.models import OrderBook
+
+
+class OrderBookEqualityTest(unittest.TestCase):
+    def _book(self, **overrides):
+        fields = dict(
+            symbol="BTC/USDT",
+            timestamp=1710496800000,
+            bids=[[100.0, 1.5], [99.5, 2.0]],
+            asks=[[100.5, 0.7], [101.0, 3.0]],
+            nonce=42,
+        )
+        fields.update(overrides)
+        return OrderBook(**fields)
+
+    def test_books_with_same_levels_are_equal(self):
+        self.assertEqual(self._book(), self._book())
+
+    def test_books_with_different_levels_are_not_equal(self):
+        self.assertNotEqual(self._book(), self._book(asks=[[100.5, 0.8], [101.0, 3.0]]))
+        self.assertNotEqual(self._book(), self._book(bids=[[100.0, 1.5]]))
+        self.assertNotEqual(self._book(), self._book(nonce=43))
+
+    def test_model_dump_round_trip(self):
+        book = self._book()
+        dumped = book.model_dump()
+        self.assertEqual(dumped["bids"], [[100.0, 1.5], [99.5, 2.0]])
+        self.assertEqual(OrderBook(**dumped), book)
+
+
+if __name__ == "__main__":
+    unittest.main()
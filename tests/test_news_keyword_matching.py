@@ -0,0 +1,43 @@
+# tests/test_news_keyword_matching.py
+import unittest
+
+from crypto_news_aggregator.news_sources.base_source import BaseNewsSource
+
+
+class _StubSource(BaseNewsSource):
+    def fetch_news(self, target_coins_keywords, limit=10):
+        return []
+
+
+class KeywordPatternMatchingTest(unittest.TestCase):
+    TARGETS = {"BTC": ["Bitcoin", "BTC"], "SOL": ["Solana", "SOL"]}
+
+    def test_non_ascii_case_fold_hit_does_not_raise(self):
+        # "ſ" (long s) matches "s" under re.IGNORECASE but does not lowercase to it
+        pattern, keyword_to_coins = BaseNewsSource._build_keyword_matcher(self.TARGETS)
+        coins = BaseNewsSource._find_coins_with_pattern(pattern, keyword_to_coins, "ſolana up, Bitcoin flat")
+        self.assertIn("BTC", coins)
+
+    def test_non_ascii_case_fold_hit_resolves_to_its_coin(self):
+        pattern, keyword_to_coins = BaseNewsSource._build_keyword_matcher(self.TARGETS)
+        coins = BaseNewsSource._find_coins_with_pattern(pattern, keyword_to_coins, "ſolana up")
+        self.assertEqual(coins, {"SOL"})
+
+    def test_repeated_hits_in_mixed_case(self):
+        pattern, keyword_to_coins = BaseNewsSource._build_keyword_matcher(self.TARGETS)
+        coins = BaseNewsSource._find_coins_with_pattern(pattern, keyword_to_coins, "BTC, bitcoin and BITCOIN; no solanas")
+        self.assertEqual(coins, {"BTC"})
+
+    def test_case_fold_hit_keeps_rest_of_batch(self):
+        raw_items = [
+            {"title": "ſolana up", "link": "https://example.com/1", "date": "2024-03-15T10:00:00Z"},
+            {"title": "Bitcoin flat", "link": "https://example.com/2", "date": "2024-03-15T11:00:00Z"},
+        ]
+        articles = _StubSource("stub")._filter_and_create_articles(
+            raw_items, self.TARGETS, title_key="title", link_key="link", date_key="date"
+        )
+        self.assertIn("https://example.com/2", [article.link for article in articles])
+
+
+if __name__ == "__main__":
+    unittest.main()